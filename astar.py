@@ -1,70 +1,273 @@
-
 # astar.py
 # Implementação do algoritmo A* em cima do labirinto (representado como grafo implícito).
 
-from typing import List, Tuple, Dict
+from __future__ import annotations
+from array import array
+from typing import Dict, List, Sequence, Tuple
 import heapq
 import math
 from maze import Maze
+# movimentos, custos e máscaras de movimentos livres compartilhados com o GA
+from moves import SQRT2, move_masks, open_steps
+
+_OCTILE_EXTRA = SQRT2 - 1.0
+
+
+def _octile(dr: int, dc: int) -> float:
+    """Heurística admissível e consistente: distância octil.
+
+    É o custo exato do caminho em um grid 8-conexo sem paredes, logo mais
+    justa que a distância Euclidiana.
+    """
+    if dr < 0:
+        dr = -dr
+    if dc < 0:
+        dc = -dc
+    if dr < dc:
+        return dc + _OCTILE_EXTRA * dr
+    return dr + _OCTILE_EXTRA * dc
+
+
+def _rebuild_path(maze: Maze, parent: array, node: int) -> List[Tuple[int, int]]:
+    coords = maze.coords
+    path: List[Tuple[int, int]] = [coords(node)]
+    node = parent[node]
+    while node >= 0:
+        path.append(coords(node))
+        node = parent[node]
+    path.reverse()
+    return path
+
 
-# Mesma codificação de movimentos usada no algoritmo genético.
-MOVES = {
-    1: (-1, 0),   # cima
-    2: (0, 1),    # direita
-    3: (1, 0),    # baixo
-    4: (0, -1),   # esquerda
-    5: (-1, 1),   # cima-direita
-    6: (1, 1),    # baixo-direita
-    7: (1, -1),   # baixo-esquerda
-    8: (-1, -1),  # cima-esquerda
-}
-
-def _heuristic(a: Tuple[int, int], b: Tuple[int, int]) -> float:
-    """Heurística admissível: distância Euclidiana."""
-    (x1, y1), (x2, y2) = a, b
-    return math.hypot(x1 - x2, y1 - y2)
-
-def astar(maze: Maze, start: Tuple[int, int], goal: Tuple[int, int]):
+def astar(
+    maze: Maze,
+    start: Tuple[int, int],
+    goal: Tuple[int, int],
+    stats: Dict[str, int] | None = None,
+):
     """Retorna o caminho de start até goal (lista de coordenadas) usando A*.
 
-    Se não houver caminho, retorna None.
+    Se não houver caminho, retorna None. Se `stats` for dado, recebe em
+    "expanded" o número de nós expandidos.
+
+    Os nós são índices lineares do mapa com borda do labirinto; custo `g`,
+    pai e conjunto fechado ficam em buffers pré-alocados (`array`/`bytearray`)
+    em vez de dicionários com tuplas, e só os vizinhos livres de cada nó
+    (máscara de movimentos do labirinto) são percorridos. Como a heurística
+    octil é consistente, um nó fechado nunca é reaberto e entradas antigas da
+    fila são descartadas ao sair dela.
     """
-    open_heap: List[Tuple[float, Tuple[int, int]]] = []
-    heapq.heappush(open_heap, (0.0, start))
+    stride = maze.stride
+    size = len(maze.free)
+    masks = move_masks(maze)
+    steps = open_steps(stride)
+    src = maze.index(*start)
+    dst = maze.index(*goal)
+    # o objetivo em coordenadas do mapa com borda, para a heurística
+    goal_r, goal_c = divmod(dst, stride)
+
+    g = array('d', [math.inf]) * size
+    parent = array('i', [-1]) * size
+    closed = bytearray(size)
+    push = heapq.heappush
+    pop = heapq.heappop
 
-    came_from: Dict[Tuple[int, int], Tuple[int, int]] = {}
-    g_score: Dict[Tuple[int, int], float] = {start: 0.0}
+    g[src] = 0.0
+    open_heap: List[Tuple[float, int]] = [(_octile(start[0] - goal[0], start[1] - goal[1]), src)]
+    expanded = 0
+    path = None
 
     while open_heap:
-        current_f, current = heapq.heappop(open_heap)
-        if current == goal:
-            # reconstrói caminho
-            path: List[Tuple[int, int]] = [current]
-            while current in came_from:
-                current = came_from[current]
-                path.append(current)
-            path.reverse()
-            return path
-
-        if current_f > g_score.get(current, float('inf')) + _heuristic(current, goal):
-            # nó desatualizado
+        _, current = pop(open_heap)
+        if closed[current]:
+            # entrada desatualizada
             continue
+        if current == dst:
+            path = _rebuild_path(maze, parent, current)
+            break
+        closed[current] = 1
+        expanded += 1
 
-        cr, cc = current
-        for dr, dc in MOVES.values():
-            nr, nc = cr + dr, cc + dc
-            if not maze.is_free(nr, nc):
+        current_g = g[current]
+        for offset, step_cost in steps[masks[current]]:
+            neighbor = current + offset
+            if closed[neighbor]:
                 continue
+            tentative_g = current_g + step_cost
+            if tentative_g < g[neighbor]:
+                g[neighbor] = tentative_g
+                parent[neighbor] = current
+                nr, nc = divmod(neighbor, stride)
+                push(open_heap, (tentative_g + _octile(nr - goal_r, nc - goal_c), neighbor))
+
+    if stats is not None:
+        stats["expanded"] = expanded
+    return path
+
+
+def bidirectional_astar(
+    maze: Maze,
+    start: Tuple[int, int],
+    goal: Tuple[int, int],
+    stats: Dict[str, int] | None = None,
+):
+    """A* bidirecional: mesmo contrato (e mesmo custo de caminho) que `astar`.
+
+    Uma busca sai de `start` guiada pela distância octil até `goal` e a outra
+    sai de `goal` guiada pela distância até `start` (os movimentos são
+    simétricos, então o grafo reverso é o próprio grid). A cada passo
+    expande-se o lado com a menor fila. `best` guarda o menor custo de
+    caminho já visto ligando as duas buscas; como toda ligação melhor teria
+    de passar por um nó aberto de cada lado, a busca termina quando o menor
+    f de qualquer uma das filas já não é menor que `best`.
+    """
+    stride = maze.stride
+    size = len(maze.free)
+    masks = move_masks(maze)
+    steps = open_steps(stride)
+    src = maze.index(*start)
+    dst = maze.index(*goal)
+    push = heapq.heappush
+    pop = heapq.heappop
+
+    if src == dst:
+        if stats is not None:
+            stats["expanded"] = 0
+        return [start]
+    if not maze.free[dst]:
+        # como em `astar`, um objetivo na parede nunca é alcançado (a
+        # partida pode ser parede: o primeiro passo sai dela)
+        if stats is not None:
+            stats["expanded"] = 0
+        return None
+
+    # índice 0: busca direta (alvo dst); índice 1: busca reversa (alvo src)
+    g = (array('d', [math.inf]) * size, array('d', [math.inf]) * size)
+    parent = (array('i', [-1]) * size, array('i', [-1]) * size)
+    closed = (bytearray(size), bytearray(size))
+    targets = (divmod(dst, stride), divmod(src, stride))
+    g[0][src] = 0.0
+    g[1][dst] = 0.0
+    heaps: Tuple[List[Tuple[float, int]], List[Tuple[float, int]]] = (
+        [(_octile(start[0] - goal[0], start[1] - goal[1]), src)],
+        [(_octile(start[0] - goal[0], start[1] - goal[1]), dst)],
+    )
 
-            # custo de passo: 1 para ortogonais, sqrt(2) para diagonais
-            step_cost = math.sqrt(2.0) if abs(dr) + abs(dc) == 2 else 1.0
-            tentative_g = g_score[current] + step_cost
+    best = math.inf
+    meet = -1
+    expanded = 0
 
-            neighbor = (nr, nc)
-            if tentative_g < g_score.get(neighbor, float('inf')):
-                came_from[neighbor] = current
-                g_score[neighbor] = tentative_g
-                f_score = tentative_g + _heuristic(neighbor, goal)
-                heapq.heappush(open_heap, (f_score, neighbor))
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] >= best or heaps[1][0][0] >= best:
+            break
+        side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+        heap = heaps[side]
+        _, current = pop(heap)
+        done = closed[side]
+        if done[current]:
+            continue
+        done[current] = 1
+        expanded += 1
+
+        my_g = g[side]
+        other_g = g[1 - side]
+        my_parent = parent[side]
+        target_r, target_c = targets[side]
+        current_g = my_g[current]
+        for offset, step_cost in steps[masks[current]]:
+            neighbor = current + offset
+            if done[neighbor]:
+                continue
+            tentative_g = current_g + step_cost
+            if tentative_g < my_g[neighbor]:
+                my_g[neighbor] = tentative_g
+                my_parent[neighbor] = current
+                nr, nc = divmod(neighbor, stride)
+                push(heap, (tentative_g + _octile(nr - target_r, nc - target_c), neighbor))
+                # o vizinho já foi alcançado pelo outro lado: caminho completo
+                through = tentative_g + other_g[neighbor]
+                if through < best:
+                    best = through
+                    meet = neighbor
+
+    if stats is not None:
+        stats["expanded"] = expanded
+    if meet < 0:
+        return None
+
+    path = _rebuild_path(maze, parent[0], meet)
+    coords = maze.coords
+    node = parent[1][meet]
+    while node >= 0:
+        path.append(coords(node))
+        node = parent[1][node]
+    return path
+
+
+def astar_nearest(
+    maze: Maze,
+    start: Tuple[int, int],
+    goals: Sequence[Tuple[int, int]],
+    stats: Dict[str, int] | None = None,
+):
+    """Caminho de custo mínimo de `start` até o mais próximo dos `goals`.
+
+    Uma única busca A* com a heurística igual à menor distância octil até
+    qualquer um dos objetivos (o mínimo de heurísticas consistentes continua
+    consistente), em vez de uma chamada de `astar` por objetivo. O objetivo
+    alcançado é o último ponto do caminho; devolve None se nenhum for
+    alcançável.
+    """
+    stride = maze.stride
+    size = len(maze.free)
+    masks = move_masks(maze)
+    steps = open_steps(stride)
+    src = maze.index(*start)
+    is_goal = bytearray(size)
+    goal_cells = []
+    for r, c in goals:
+        node = maze.index(r, c)
+        is_goal[node] = 1
+        goal_cells.append(divmod(node, stride))
+    if not goal_cells:
+        raise ValueError("astar_nearest precisa de pelo menos um objetivo")
+
+    def h(node: int) -> float:
+        r, c = divmod(node, stride)
+        return min(_octile(r - gr, c - gc) for gr, gc in goal_cells)
+
+    g = array('d', [math.inf]) * size
+    parent = array('i', [-1]) * size
+    closed = bytearray(size)
+    push = heapq.heappush
+    pop = heapq.heappop
+
+    g[src] = 0.0
+    open_heap: List[Tuple[float, int]] = [(h(src), src)]
+    expanded = 0
+    path = None
+
+    while open_heap:
+        _, current = pop(open_heap)
+        if closed[current]:
+            continue
+        if is_goal[current]:
+            path = _rebuild_path(maze, parent, current)
+            break
+        closed[current] = 1
+        expanded += 1
+
+        current_g = g[current]
+        for offset, step_cost in steps[masks[current]]:
+            neighbor = current + offset
+            if closed[neighbor]:
+                continue
+            tentative_g = current_g + step_cost
+            if tentative_g < g[neighbor]:
+                g[neighbor] = tentative_g
+                parent[neighbor] = current
+                push(open_heap, (tentative_g + h(neighbor), neighbor))
 
-    return None
+    if stats is not None:
+        stats["expanded"] = expanded
+    return path
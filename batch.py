@@ -0,0 +1,231 @@
+# batch.py
+# Modo em lote: resolve muitos labirintos (GA + A*) numa única execução,
+# com um pool de processos e um resumo em JSONL gravado à medida que
+# cada labirinto termina.
+
+from __future__ import annotations
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+from maze import Maze
+from genetic import GeneticSolver
+from moves import path_cost
+from distfield import load_distance_field
+from prune import fill_dead_ends
+from main import SEARCHES, write_output_file
+
+# sufixos dos arquivos gravados pelo próprio programa; nunca são entradas
+OUTPUT_SUFFIXES = ("_saida_genetico.txt", "_saida_aestrela.txt")
+
+
+def expand_inputs(patterns: Iterable[str], manifest: str | None = None) -> List[str]:
+    """Arquivos de entrada a partir de padrões glob e/ou de uma lista em arquivo.
+
+    A lista tem um caminho por linha (linhas vazias e começadas por '#' são
+    ignoradas). Caminhos repetidos aparecem uma vez só, na ordem em que
+    surgiram, e as saídas "_saida_*.txt" de execuções anteriores são puladas.
+    """
+    candidates: List[str] = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True))
+        candidates.extend(matches if matches else [pattern])
+    if manifest is not None:
+        with open(manifest, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    candidates.append(line)
+
+    seen = set()
+    files = []
+    for path in candidates:
+        if path in seen or path.endswith(OUTPUT_SUFFIXES):
+            continue
+        seen.add(path)
+        files.append(path)
+    return files
+
+
+def output_bases(files: List[str], destino: str | None = None) -> List[str]:
+    """Prefixo dos arquivos de saída de cada entrada.
+
+    Sem `destino`, as saídas ficam ao lado da entrada. Com ele, levam o
+    nome do arquivo; entradas de pastas diferentes com o mesmo nome
+    recebem o índice na frente ("3_lab.txt_saida_...") para não
+    sobrescreverem as saídas umas das outras.
+    """
+    if not destino:
+        return list(files)
+    names = [os.path.basename(path) for path in files]
+    counts = Counter(names)
+    return [
+        os.path.join(destino, name if counts[name] == 1 else f"{i}_{name}")
+        for i, name in enumerate(names)
+    ]
+
+
+def solve_file(path: str, seed: int, options: Dict[str, Any], out_base: str | None = None) -> Dict[str, Any]:
+    """Resolve um labirinto como o main.py (GA e depois A*), sem imprimir nada.
+
+    Com a semente devolvida, `python main.py <arquivo> --semente S` refaz a
+    mesma execução do GA. `options["ga_tempo"]` limita, em segundos, o tempo
+    do GA; ao estourar, o status é "ga_falhou" e "motivo" diz qual limite
+    parou o GA. As saídas vão para `out_base` + "_saida_*.txt" (padrão: ao
+    lado da entrada, ou em `options["destino"]`; ver `output_bases`).
+
+    Qualquer falha (leitura, GA, busca, gravação das saídas) vira o status
+    "erro" deste labirinto, sem interromper o restante do lote.
+    """
+    t0 = time.perf_counter()
+    record: Dict[str, Any] = {"arquivo": path, "semente": seed}
+    try:
+        if out_base is None:
+            out_base = output_bases([path], options.get("destino"))[0]
+        _solve_into(record, path, seed, options, out_base)
+    except (OSError, ValueError) as e:
+        record.update(status="erro", erro=str(e))
+    except Exception as e:
+        record.update(status="erro", erro=f"{type(e).__name__}: {e}")
+    record["tempo_s"] = time.perf_counter() - t0
+    return record
+
+
+def _solve_into(record: Dict[str, Any], path: str, seed: int, options: Dict[str, Any], out_base: str) -> None:
+    maze = Maze.load(path)
+    record["n"] = maze.n
+
+    # GA e busca no labirinto podado; as saídas usam o original
+    work = fill_dead_ends(maze) if options.get("podar") else maze
+    search = SEARCHES[options.get("busca", "astar")]
+    # sem caminho de E até S o GA nunca pararia: confere antes com a busca
+    a_path = search(work, work.start, work.exit)
+    if not a_path:
+        record["status"] = "sem_caminho"
+        return
+
+    field = load_distance_field(work) if options.get("campo") else None
+    solver = GeneticSolver(work, distance_field=field, adaptive=options.get("adaptativo", False), seed=seed)
+    # a busca acima já mostrou que S é alcançável
+    result = solver.run(verbose=False, time_limit=options.get("ga_tempo"), check_reachable=False)
+    ga_path = result.path if result.found and result.path[-1] == maze.exit else None
+    record["tentativas"] = result.attempts
+    record["geracoes"] = result.generations
+    record["motivo"] = result.reason
+    record["passos_astar"] = len(a_path) - 1
+    record["custo_astar"] = path_cost(a_path)
+
+    if ga_path is None:
+        record["status"] = "ga_falhou"
+    else:
+        record["status"] = "ok"
+        record["passos_ga"] = len(ga_path) - 1
+        write_output_file(out_base + "_saida_genetico.txt", maze, ga_path)
+    write_output_file(out_base + "_saida_aestrela.txt", maze, a_path)
+
+
+def run_batch(
+    files: List[str],
+    summary,
+    workers: int | None = None,
+    base_seed: int = 0,
+    **options,
+) -> Dict[str, int]:
+    """Resolve `files` num pool de `workers` processos e grava o resumo.
+
+    No máximo 2 * workers labirintos ficam na fila do pool por vez, então a
+    memória não cresce com o tamanho do lote. Cada resultado vira uma linha
+    JSON em `summary` assim que fica pronto (na ordem de término; o campo
+    "indice" dá a posição original). Devolve a contagem por status.
+    """
+    workers = workers or os.cpu_count() or 1
+    counts: Dict[str, int] = {}
+
+    def emit(index: int, record: Dict[str, Any]) -> None:
+        record["indice"] = index
+        summary.write(json.dumps(record, ensure_ascii=False) + "\n")
+        summary.flush()
+        counts[record["status"]] = counts.get(record["status"], 0) + 1
+
+    bases = output_bases(files, options.get("destino"))
+    jobs: Iterator = ((i, path, base_seed + i, bases[i]) for i, path in enumerate(files))
+    if workers == 1:
+        for i, path, seed, out_base in jobs:
+            emit(i, solve_file(path, seed, options, out_base))
+        return counts
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = {}
+        for i, path, seed, out_base in jobs:
+            pending[pool.submit(solve_file, path, seed, options, out_base)] = i
+            if len(pending) >= 2 * workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    emit(pending.pop(fut), fut.result())
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                emit(pending.pop(fut), fut.result())
+    return counts
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv
+
+    parser = argparse.ArgumentParser(
+        prog="batch.py",
+        description="Resolve vários labirintos (GA + A*) em paralelo, com resumo em JSONL.",
+    )
+    parser.add_argument("padroes", nargs="*", metavar="PADRAO",
+                        help="arquivos ou padrões glob (ex.: 'labs/**/*.txt')")
+    parser.add_argument("--lista", default=None, metavar="ARQ",
+                        help="arquivo com um caminho de labirinto por linha")
+    parser.add_argument("--trabalhadores", type=int, default=None, metavar="N",
+                        help="processos simultâneos (padrão: número de núcleos)")
+    parser.add_argument("--resumo", default="resumo_lote.jsonl", metavar="ARQ",
+                        help="arquivo do resumo (padrão: resumo_lote.jsonl; '-' = tela)")
+    parser.add_argument("--destino", default=None, metavar="DIR",
+                        help="pasta das saídas (padrão: ao lado de cada labirinto)")
+    parser.add_argument("--semente", type=int, default=0, metavar="S",
+                        help="o labirinto de índice i usa a semente S + i")
+    parser.add_argument("--ga-tempo", type=float, default=60.0, metavar="SEGUNDOS",
+                        help="tempo máximo do GA por labirinto (padrão 60; 0 = sem limite)")
+    parser.add_argument("--busca", choices=tuple(SEARCHES), default="astar")
+    parser.add_argument("--campo", action="store_true")
+    parser.add_argument("--adaptativo", action="store_true")
+    parser.add_argument("--podar", action="store_true")
+    args = parser.parse_args(argv[1:])
+
+    files = expand_inputs(args.padroes, args.lista)
+    if not files:
+        parser.error("nenhum labirinto informado")
+    if args.destino:
+        os.makedirs(args.destino, exist_ok=True)
+
+    t0 = time.perf_counter()
+    summary = sys.stdout if args.resumo == "-" else open(args.resumo, "w", encoding="utf-8")
+    try:
+        counts = run_batch(
+            files, summary, workers=args.trabalhadores, base_seed=args.semente,
+            busca=args.busca, campo=args.campo, destino=args.destino,
+            adaptativo=args.adaptativo, podar=args.podar,
+            ga_tempo=args.ga_tempo or None,
+        )
+    finally:
+        if summary is not sys.stdout:
+            summary.close()
+
+    report = ", ".join(f"{status}: {count}" for status, count in sorted(counts.items()))
+    print(f"{len(files)} labirintos em {time.perf_counter() - t0:.1f}s ({report})", file=sys.stderr)
+    return 0 if counts.get("ok", 0) == len(files) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,171 @@
+# benchmark.py
+# Suíte de desempenho reproduzível: gera labirintos por semente e mede a
+# leitura, o A* (unidirecional e bidirecional), o JPS, o Algoritmo Genético
+# e a gravação da saída.
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, List
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from maze import Maze
+from astar import astar, bidirectional_astar
+from jps import jps
+from genetic import GeneticSolver
+from mazegen import KINDS, generate
+from moves import path_cost
+from main import write_output_file
+
+# gerações repetidas sob tracemalloc para medir o pico de memória do GA
+GA_MEMORY_GENERATIONS = 200
+
+
+def _peak_mb(fn: Callable[[], Any]) -> float:
+    """Pico de memória alocada (MB) durante `fn`, medido com tracemalloc."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1] / 2 ** 20
+    finally:
+        tracemalloc.stop()
+
+
+def _timed(fn: Callable[[], Any]):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+
+def _bench_search(search, maze: Maze, memory: bool):
+    stats: Dict[str, int] = {}
+    path, elapsed = _timed(lambda: search(maze, maze.start, maze.exit, stats=stats))
+    record = {
+        "tempo_s": elapsed,
+        "expandidos": stats["expanded"],
+        "custo": path_cost(path) if path else None,
+    }
+    if memory:
+        record["pico_mb"] = _peak_mb(lambda: search(maze, maze.start, maze.exit))
+    return record, path
+
+
+def _bench_ga(maze: Maze, seed: int, time_limit: float, memory: bool, solver_kwargs) -> Dict[str, Any]:
+    """Roda o GA com semente fixa até achar S ou esgotar `time_limit` segundos."""
+    solver = GeneticSolver(maze, seed=seed, **solver_kwargs)
+    result, elapsed = _timed(lambda: solver.run(verbose=False, time_limit=time_limit))
+    found = result.found and bool(result.path) and result.path[-1] == maze.exit
+    generations = result.generations
+    record = {
+        "tempo_s": elapsed,
+        "geracoes": generations,
+        "avaliacoes": result.evaluations,
+        "achou_saida": found,
+        "motivo": result.reason,
+    }
+
+    if memory:
+        # repete as mesmas gerações (no máximo GA_MEMORY_GENERATIONS, já que
+        # o uso de memória se estabiliza logo), agora medindo memória
+        limit = min(generations, GA_MEMORY_GENERATIONS)
+        count = 0
+
+        def same_generations() -> bool:
+            nonlocal count
+            count += 1
+            return count > limit
+
+        solver = GeneticSolver(maze, seed=seed, **solver_kwargs)
+        record["pico_mb"] = _peak_mb(lambda: solver.run(verbose=False, should_stop=same_generations))
+    return record
+
+
+def run_case(
+    kind: str,
+    n: int,
+    seed: int,
+    workdir: str,
+    ga_time: float = 10.0,
+    memory: bool = True,
+    solver_kwargs: Dict[str, Any] | None = None,
+) -> Dict[str, Any]:
+    """Mede todas as etapas para um labirinto gerado (tipo, tamanho, semente)."""
+    solver_kwargs = solver_kwargs or {}
+    lab_file = os.path.join(workdir, f"{kind}_{n}_{seed}.txt")
+    generate(kind, n, seed).save_text(lab_file)
+
+    maze, load_s = _timed(lambda: Maze.from_file(lab_file))
+    record: Dict[str, Any] = {
+        "tipo": kind,
+        "n": n,
+        "semente": seed,
+        "leitura": {"tempo_s": load_s},
+    }
+    if memory:
+        record["leitura"]["pico_mb"] = _peak_mb(lambda: Maze.from_file(lab_file))
+
+    record["astar"], path = _bench_search(astar, maze, memory)
+    record["astar_bidirecional"], _ = _bench_search(bidirectional_astar, maze, memory)
+    record["jps"], _ = _bench_search(jps, maze, memory)
+    record["ga"] = _bench_ga(maze, seed, ga_time, memory, solver_kwargs)
+
+    if path:
+        out = lab_file + "_saida_aestrela.txt"
+        _, write_s = _timed(lambda: write_output_file(out, maze, path))
+        record["gravacao"] = {"tempo_s": write_s}
+        if memory:
+            record["gravacao"]["pico_mb"] = _peak_mb(lambda: write_output_file(out, maze, path))
+    return record
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv
+
+    parser = argparse.ArgumentParser(
+        prog="benchmark.py",
+        description="Mede leitura, A*, JPS, GA e gravação em labirintos gerados por semente.",
+    )
+    parser.add_argument("--tipos", default=",".join(KINDS),
+                        help=f"tipos de labirinto separados por vírgula ({', '.join(KINDS)})")
+    parser.add_argument("--tamanhos", default="10,100,500",
+                        help="tamanhos n separados por vírgula (10 a 5000)")
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--ga-tempo", type=float, default=10.0, metavar="SEGUNDOS",
+                        help="tempo máximo do GA por labirinto")
+    parser.add_argument("--adaptativo", action="store_true",
+                        help="usa o GA adaptativo (parâmetros dimensionados pelo labirinto)")
+    parser.add_argument("--sem-memoria", action="store_true",
+                        help="não mede o pico de memória (evita repetir cada etapa)")
+    parser.add_argument("--saida", default=None, metavar="ARQUIVO",
+                        help="grava o relatório JSON neste arquivo (padrão: tela)")
+    args = parser.parse_args(argv[1:])
+
+    kinds = [k for k in args.tipos.split(",") if k]
+    sizes = [int(n) for n in args.tamanhos.split(",") if n]
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="bench_labirinto_") as workdir:
+        for kind in kinds:
+            for n in sizes:
+                print(f"{kind} {n}x{n}...", file=sys.stderr)
+                results.append(run_case(
+                    kind, n, args.semente, workdir,
+                    ga_time=args.ga_tempo, memory=not args.sem_memoria,
+                    solver_kwargs={"adaptive": args.adaptativo},
+                ))
+
+    report = json.dumps({"python": sys.version.split()[0], "resultados": results}, indent=2)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,212 @@
+# checkpoint.py
+# Checkpoints binários do GA (população, estado do gerador aleatório,
+# contadores e melhor indivíduo), gravados numa thread à parte para que o
+# laço evolutivo não espere o disco.
+
+from __future__ import annotations
+from array import array
+from dataclasses import dataclass
+from typing import List, Tuple
+import os
+import struct
+import threading
+
+# Formato: cabeçalho (assinatura, versão, hash do labirinto, entrada, saída,
+# configuração do GA), contadores, estado do gerador (versão + 625 palavras
+# de 32 bits + gauss_next), melhor indivíduo e a população (tamanhos dos
+# cromossomos seguidos dos genes, um byte por gene).
+CHECKPOINT_MAGIC = b'GAC1'
+CHECKPOINT_VERSION = 1
+_HEADER = struct.Struct('<4sH32siiiiIIIB')
+_COUNTERS = struct.Struct('<IIQQIddI')
+_RNG = struct.Struct('<IBd')
+_RNG_WORDS = 625
+_BEST = struct.Struct('<BdBI')
+
+
+@dataclass
+class GACheckpoint:
+    """Estado do GA no início de uma geração, suficiente para continuar a
+    execução exatamente de onde parou (ver `GeneticSolver.resume`).
+
+    `population` e `best_chromosome` guardam os genes como bytes (1..8).
+    """
+    maze_hash: str
+    start: Tuple[int, int]
+    exit: Tuple[int, int]
+    population_size: int
+    chromosome_length: int
+    max_generations: int
+    adaptive: bool
+    attempt: int
+    generation: int          # geração dentro da tentativa
+    generations: int         # gerações avaliadas, somando as tentativas
+    evaluations: int
+    stale: int               # gerações sem melhorar a melhor aptidão
+    mutation_rate: float
+    attempt_best: float      # estado da mutação adaptativa
+    stagnant: int
+    rng_state: tuple
+    population: List[bytes]
+    best_chromosome: bytes | None
+    best_fitness: float
+    best_reached: bool
+
+
+def encode_checkpoint(state: GACheckpoint) -> bytes:
+    version, words, gauss_next = state.rng_state
+    if len(words) != _RNG_WORDS:
+        raise ValueError(f"Estado do gerador com {len(words)} palavras, esperado {_RNG_WORDS}")
+    parts = [
+        _HEADER.pack(
+            CHECKPOINT_MAGIC, CHECKPOINT_VERSION, bytes.fromhex(state.maze_hash),
+            *state.start, *state.exit,
+            state.population_size, state.chromosome_length, state.max_generations,
+            state.adaptive,
+        ),
+        _COUNTERS.pack(
+            state.attempt, state.generation, state.generations, state.evaluations,
+            state.stale, state.mutation_rate, state.attempt_best, state.stagnant,
+        ),
+        _RNG.pack(version, gauss_next is not None, gauss_next or 0.0),
+        array('I', words).tobytes(),
+    ]
+    best = state.best_chromosome
+    parts.append(_BEST.pack(best is not None, state.best_fitness, state.best_reached, len(best or b'')))
+    parts.append(best or b'')
+    parts.append(struct.pack('<I', len(state.population)))
+    parts.append(array('I', map(len, state.population)).tobytes())
+    parts.extend(state.population)
+    return b''.join(parts)
+
+
+def decode_checkpoint(data) -> GACheckpoint:
+    if len(data) < _HEADER.size or data[:len(CHECKPOINT_MAGIC)] != CHECKPOINT_MAGIC:
+        raise ValueError("Arquivo não é um checkpoint do GA")
+    try:
+        (_, version, digest, start_r, start_c, exit_r, exit_c,
+         population_size, chromosome_length, max_generations, adaptive) = _HEADER.unpack_from(data, 0)
+        if version != CHECKPOINT_VERSION:
+            raise ValueError(f"Versão de checkpoint {version} não suportada (esperada {CHECKPOINT_VERSION})")
+        pos = _HEADER.size
+        (attempt, generation, generations, evaluations,
+         stale, mutation_rate, attempt_best, stagnant) = _COUNTERS.unpack_from(data, pos)
+        pos += _COUNTERS.size
+        rng_version, has_gauss, gauss_next = _RNG.unpack_from(data, pos)
+        pos += _RNG.size
+        words = array('I')
+        words.frombytes(data[pos:pos + 4 * _RNG_WORDS])
+        pos += 4 * _RNG_WORDS
+        has_best, best_fitness, best_reached, best_len = _BEST.unpack_from(data, pos)
+        pos += _BEST.size
+        best = bytes(data[pos:pos + best_len]) if has_best else None
+        pos += best_len
+        (count,) = struct.unpack_from('<I', data, pos)
+        pos += 4
+        lengths = array('I')
+        lengths.frombytes(data[pos:pos + 4 * count])
+        pos += 4 * count
+        population = []
+        for length in lengths:
+            population.append(bytes(data[pos:pos + length]))
+            pos += length
+    except struct.error as e:
+        raise ValueError(f"Checkpoint truncado: {e}") from None
+    if len(words) != _RNG_WORDS or pos != len(data):
+        raise ValueError(f"Checkpoint truncado ou corrompido ({len(data)} bytes)")
+
+    return GACheckpoint(
+        maze_hash=digest.hex(),
+        start=(start_r, start_c),
+        exit=(exit_r, exit_c),
+        population_size=population_size,
+        chromosome_length=chromosome_length,
+        max_generations=max_generations,
+        adaptive=bool(adaptive),
+        attempt=attempt,
+        generation=generation,
+        generations=generations,
+        evaluations=evaluations,
+        stale=stale,
+        mutation_rate=mutation_rate,
+        attempt_best=attempt_best,
+        stagnant=stagnant,
+        rng_state=(rng_version, tuple(words), gauss_next if has_gauss else None),
+        population=population,
+        best_chromosome=best,
+        best_fitness=best_fitness,
+        best_reached=bool(best_reached),
+    )
+
+
+def save_checkpoint(path: str, state: GACheckpoint) -> None:
+    """Grava o checkpoint de forma atômica (arquivo temporário + rename):
+    um processo morto no meio da gravação deixa o checkpoint anterior intacto.
+    """
+    data = encode_checkpoint(state)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path: str) -> GACheckpoint:
+    with open(path, 'rb') as f:
+        return decode_checkpoint(f.read())
+
+
+class CheckpointWriter:
+    """Grava checkpoints em `path` numa thread própria.
+
+    `submit` só entrega o estado já copiado e volta na hora; se a gravação
+    anterior ainda não terminou, o estado pendente é substituído pelo mais
+    novo (só o último importa). `close` espera o pendente ser gravado e
+    repassa o erro de gravação, se houve algum.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.written = 0
+        self._pending: GACheckpoint | None = None
+        self._closed = False
+        self._error: OSError | None = None
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._loop, name="ga-checkpoint", daemon=True)
+        self._thread.start()
+
+    def submit(self, state: GACheckpoint) -> None:
+        with self._cond:
+            if self._closed:
+                raise ValueError("CheckpointWriter já foi fechado")
+            self._pending = state
+            self._cond.notify()
+
+    def _loop(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                state = self._pending
+                self._pending = None
+            if state is None:
+                return
+            try:
+                save_checkpoint(self.path, state)
+                self.written += 1
+            except OSError as e:
+                self._error = e
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def __enter__(self) -> "CheckpointWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,45 @@
+# converter.py
+# Conversão entre o formato texto do enunciado e o formato binário compacto.
+
+import os
+import sys
+
+from maze import BINARY_MAGIC, Maze
+
+
+def to_binary(src: str, dst: str) -> None:
+    Maze.from_file(src).save_binary(dst)
+
+
+def to_text(src: str, dst: str) -> None:
+    Maze.load_binary(src).save_text(dst)
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv
+
+    if len(argv) < 2:
+        print("Uso: python converter.py <arquivo_entrada> [arquivo_saida]")
+        print("  texto   -> binário (padrão: <entrada sem extensão>.lab)")
+        print("  binário -> texto   (padrão: <entrada sem extensão>.txt)")
+        return 1
+
+    src = argv[1]
+    with open(src, "rb") as f:
+        is_binary = f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+
+    root = os.path.splitext(src)[0]
+    if is_binary:
+        dst = argv[2] if len(argv) >= 3 else root + ".txt"
+        to_text(src, dst)
+    else:
+        dst = argv[2] if len(argv) >= 3 else root + ".lab"
+        to_binary(src, dst)
+
+    print(f"{src} ({os.path.getsize(src)} bytes) -> {dst} ({os.path.getsize(dst)} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
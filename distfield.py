@@ -0,0 +1,137 @@
+# distfield.py
+# Campo de distâncias até a saída, pré-calculado e guardado em disco.
+
+from __future__ import annotations
+from array import array
+from typing import List, Tuple
+import heapq
+import math
+import os
+
+from maze import Maze
+from moves import move_masks, neighbor_steps, open_steps
+
+DEFAULT_CACHE_DIR = ".cache_distancias"
+
+
+class DistanceField:
+    """Distância de custo mínimo de cada célula até `target`.
+
+    `dist` é indexado como o mapa com borda do labirinto (`maze.index`);
+    paredes e células sem caminho até o alvo ficam com infinito.
+    """
+
+    def __init__(self, maze: Maze, target: Tuple[int, int], dist: array):
+        self.maze = maze
+        self.target = target
+        self.dist = dist
+
+    def distance(self, r: int, c: int) -> float:
+        return self.dist[self.maze.index(r, c)]
+
+    def path_from(self, start: Tuple[int, int]) -> List[Tuple[int, int]] | None:
+        """Caminho ótimo de `start` até o alvo, descendo o gradiente do campo.
+
+        Custa O(tamanho do caminho): em cada passo basta olhar os 8 vizinhos.
+        Devolve None se o alvo não for alcançável a partir de `start`. Mesmo
+        tratamento de paredes que `astar`: um alvo na parede nunca é
+        alcançado, mas a partida pode ser parede (o primeiro passo sai dela).
+        """
+        maze = self.maze
+        dist = self.dist
+        stride = maze.stride
+        steps = neighbor_steps(stride)
+        node = maze.index(*start)
+        goal = maze.index(*self.target)
+        if node != goal and not maze.free[goal]:
+            return None
+        if maze.free[node] or node == goal:
+            start_dist = dist[node]
+        else:
+            # na parede o campo é infinito: vale o melhor vizinho livre
+            start_dist = min(dist[node + offset] + step_cost for offset, step_cost in steps)
+        if start_dist == math.inf:
+            return None
+
+        coords = maze.coords
+        path = [coords(node)]
+        while node != goal:
+            best = -1
+            best_cost = math.inf
+            for offset, step_cost in steps:
+                cost = dist[node + offset] + step_cost
+                if cost < best_cost:
+                    best_cost = cost
+                    best = node + offset
+            node = best
+            path.append(coords(node))
+        return path
+
+
+def build_distance_field(maze: Maze, target: Tuple[int, int] | None = None) -> DistanceField:
+    """Dijkstra reverso a partir do alvo (por padrão, a saída) sobre o grid 8-conexo."""
+    if target is None:
+        target = maze.exit
+    size = len(maze.free)
+    masks = move_masks(maze)
+    steps = open_steps(maze.stride)
+    dist = array('d', [math.inf]) * size
+    done = bytearray(size)
+    push = heapq.heappush
+    pop = heapq.heappop
+
+    src = maze.index(*target)
+    dist[src] = 0.0
+    heap = [(0.0, src)]
+    while heap:
+        d, node = pop(heap)
+        if done[node]:
+            continue
+        done[node] = 1
+        for offset, step_cost in steps[masks[node]]:
+            neighbor = node + offset
+            if done[neighbor]:
+                continue
+            nd = d + step_cost
+            if nd < dist[neighbor]:
+                dist[neighbor] = nd
+                push(heap, (nd, neighbor))
+    return DistanceField(maze, target, dist)
+
+
+def _cache_path(maze: Maze, target: Tuple[int, int], cache_dir: str) -> str:
+    return os.path.join(cache_dir, f"{maze.content_hash()}_{target[0]}_{target[1]}.dist")
+
+
+def load_distance_field(
+    maze: Maze,
+    target: Tuple[int, int] | None = None,
+    cache_dir: str = DEFAULT_CACHE_DIR,
+) -> DistanceField:
+    """Devolve o campo de distâncias do labirinto, usando o cache em disco.
+
+    A chave é o hash do conteúdo do labirinto mais o alvo; se não houver
+    arquivo válido no cache, o campo é calculado e gravado.
+    """
+    if target is None:
+        target = maze.exit
+    path = _cache_path(maze, target, cache_dir)
+    expected = len(maze.free)
+
+    if os.path.exists(path):
+        dist = array('d')
+        with open(path, 'rb') as f:
+            try:
+                dist.fromfile(f, expected)
+            except EOFError:
+                dist = None
+        if dist is not None:
+            return DistanceField(maze, target, dist)
+
+    field = build_distance_field(maze, target)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        field.dist.tofile(f)
+    os.replace(tmp, path)
+    return field
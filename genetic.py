@@ -3,27 +3,22 @@
 # Implementação de um Algoritmo Genético para encontrar a saída do labirinto.
 
 from __future__ import annotations
+from array import array
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import List, Tuple
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+import heapq
 import random
 import math
+import sys
 
 from maze import Maze
-
-# Codificação dos movimentos (1..8).
-# A numeração é arbitrária, mas consistente com o A*.
-MOVES = {
-    1: (-1, 0),   # cima
-    2: (0, 1),    # direita
-    3: (1, 0),    # baixo
-    4: (0, -1),   # esquerda
-    5: (-1, 1),   # cima-direita
-    6: (1, 1),    # baixo-direita
-    7: (1, -1),   # baixo-esquerda
-    8: (-1, -1),  # cima-esquerda
-}
-GENE_VALUES = list(MOVES.keys())
+from distfield import DistanceField
+from metrics import STAGES, GAMetrics
+from checkpoint import CheckpointWriter, GACheckpoint, load_checkpoint
+# codificação dos movimentos (1..8), a mesma das buscas
+from moves import GENE_DC, GENE_DR, GENE_VALUES, MOVES, gene_offsets
 
 DIST_SCORE_CAP = 20.0
 DISTANCE_PENALTY = 2.0
@@ -48,33 +43,266 @@ TRIM_BONUS_PER_GENE = 0.8
 
 MAX_FITNESS = 120.0
 
+# byte aleatório -> gene (256 é múltiplo de 8, então todos saem com a mesma chance)
+_GENE_BYTES = bytes(GENE_VALUES[b % len(GENE_VALUES)] for b in range(256))
+
+# genes entre dois checkpoints da simulação incremental
+CHECKPOINT_INTERVAL = 16
+# segundos entre dois checkpoints gravados em disco (checkpoint.py)
+SAVE_SECONDS = 10.0
+
+# ----- modo adaptativo (adaptive=True) -----
+# comprimento de cromossomo para o qual os pesos da aptidão acima foram
+# calibrados; cromossomos maiores usam pesos por passo proporcionalmente menores
+REFERENCE_LENGTH = 20
+# caminho estimado = passos em linha reta * (1 + ADAPTIVE_TORTUOSITY * fração de paredes)
+ADAPTIVE_TORTUOSITY = 2.0
+MIN_POPULATION = 20
+MAX_POPULATION = 200
+MIN_GENERATIONS = 200
+MAX_GENERATIONS = 20000
+# com o campo de distâncias o comprimento sai da distância real, com folga para colisões
+FIELD_LENGTH_MARGIN = 1.5
+LENGTH_MUTATION_RATE = 0.2        # chance de um filho ganhar ou perder um gene
+MIN_CHROMOSOME_LENGTH = 2
+MAX_LENGTH_FACTOR = 4             # teto do comprimento, em múltiplos do inicial
+# genes mutados por filho, em média: taxa base e teto da taxa adaptada
+ADAPTIVE_MUTATIONS = 2.0
+ADAPTIVE_MAX_MUTATIONS = 8.0
+STAGNATION_WINDOW = 20            # gerações sem melhora antes de subir a mutação
+LOW_DIVERSITY = 0.5               # fração de cromossomos distintos considerada baixa
+MAX_MUTATION_RATE = 0.3
+
+# motivos de parada de `GeneticSolver.run` (campo `reason` de GAResult)
+STOP_FOUND = "saida_encontrada"
+STOP_UNREACHABLE = "saida_inalcancavel"
+STOP_CANCELLED = "cancelado"
+STOP_DEADLINE = "tempo_esgotado"
+STOP_EVALUATIONS = "avaliacoes_esgotadas"
+STOP_STAGNATION = "estagnado"
+STOP_ATTEMPTS = "tentativas_esgotadas"
+
+
+class _WalkRecord:
+    """Resultado da caminhada de um cromossomo, com checkpoints para retomada.
+
+    `checkpoints[k]` é o estado da simulação antes do gene k * CHECKPOINT_INTERVAL;
+    `trace` guarda o índice de cada célula em que o indivíduo entrou.
+    """
+    __slots__ = ("fitness", "reached_exit", "walked", "genes", "checkpoints", "trace")
+
+    def __init__(self, fitness: float, reached_exit: bool, walked: int, genes: int, checkpoints: list, trace: array):
+        self.fitness = fitness
+        self.reached_exit = reached_exit
+        self.walked = walked
+        self.genes = genes
+        self.checkpoints = checkpoints
+        self.trace = trace
+
+
 @dataclass
 class IndividualInfo:
+    """Um indivíduo separado da população (o melhor visto, o que chegou em S)."""
+    __slots__ = ("chromosome", "path", "fitness", "reached_exit")
     chromosome: List[int]
-    path: List[Tuple[int, int]]
+    path: List[Tuple[int, int]] | None  # None até ser materializado (ver `_path_of`)
     fitness: float
     reached_exit: bool
 
 
+class Population:
+    """Cromossomos de uma geração numa matriz de genes, um byte por gene.
+
+    O cromossomo i ocupa `genes[i * width : i * width + lengths[i]]`, com
+    `width` igual ao maior comprimento possível (o teto do modo adaptativo).
+    A aptidão e a chegada em S de cada um ficam em `fitness` e `reached`,
+    preenchidos por `GeneticSolver._evaluate_population`. Os indivíduos são
+    só índices: nada é alocado por indivíduo a cada geração, e o GA alterna
+    entre duas populações (a atual e a que vira a próxima geração).
+
+    `population[i]` devolve uma cópia do cromossomo em bytes.
+    """
+    __slots__ = ("size", "width", "genes", "view", "lengths", "fitness", "reached")
+
+    def __init__(self, size: int, width: int):
+        self.size = size
+        self.width = width
+        self.genes = bytearray(size * width)
+        # a matriz nunca muda de tamanho, então a vista pode ficar exportada
+        self.view = memoryview(self.genes)
+        self.lengths = array('I', [0]) * size
+        self.fitness = array('d', [0.0]) * size
+        self.reached = bytearray(size)
+
+    @classmethod
+    def from_chromosomes(cls, chromosomes: Sequence[Sequence[int]], width: int) -> "Population":
+        population = cls(len(chromosomes), width)
+        for i, chrom in enumerate(chromosomes):
+            population[i] = chrom
+        return population
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, i: int) -> bytes:
+        base = i * self.width
+        return bytes(self.view[base:base + self.lengths[i]])
+
+    def __setitem__(self, i: int, chromosome: Sequence[int]) -> None:
+        length = len(chromosome)
+        if length > self.width:
+            raise ValueError(f"Cromossomo com {length} genes não cabe na população (máximo {self.width})")
+        base = i * self.width
+        self.genes[base:base + length] = chromosome
+        self.lengths[i] = length
+
+    def __iter__(self) -> Iterator[bytes]:
+        return (self[i] for i in range(self.size))
+
+    def copy_row(self, dst: int, source: "Population", src: int) -> None:
+        """Copia o cromossomo `src` de `source` para a posição `dst`."""
+        length = source.lengths[src]
+        base = dst * self.width
+        start = src * source.width
+        self.genes[base:base + length] = source.view[start:start + length]
+        self.lengths[dst] = length
+
+    def best(self) -> int:
+        """Índice do primeiro indivíduo com a maior aptidão."""
+        return max(range(self.size), key=self.fitness.__getitem__)
+
+    def ranked(self, count: int) -> List[int]:
+        """Índices dos `count` indivíduos de maior aptidão, em ordem (empates
+        pela posição, como numa ordenação estável).
+
+        Poucos entre muitos (migrantes) saem de uma seleção parcial por heap;
+        para o grupo de elite, uma fração fixa da população, ordenar tudo
+        em C é mais rápido. As duas formas dão o mesmo resultado.
+        """
+        key = self.fitness.__getitem__
+        if count * 10 < self.size:
+            return heapq.nlargest(count, range(self.size), key=key)
+        return sorted(range(self.size), key=key, reverse=True)[:count]
+
+    def info(self, i: int) -> IndividualInfo:
+        """Cópia independente do indivíduo i (o caminho fica para `_path_of`)."""
+        base = i * self.width
+        return IndividualInfo(
+            chromosome=list(self.view[base:base + self.lengths[i]]),
+            path=None,
+            fitness=self.fitness[i],
+            reached_exit=bool(self.reached[i]),
+        )
+
+
+@dataclass
+class GAResult:
+    """Resultado de `GeneticSolver.run`.
+
+    `found` só é True quando o caminho termina em S (`reason` == STOP_FOUND);
+    nos demais casos `chromosome`/`path` são do melhor indivíduo visto, ou
+    vazios se nenhuma geração chegou a ser avaliada. `generations` e
+    `evaluations` somam todas as tentativas.
+    """
+    chromosome: List[int]
+    path: List[Tuple[int, int]]
+    found: bool
+    reason: str
+    attempts: int
+    generations: int
+    evaluations: int
+    elapsed: float
+
+
+def adaptive_parameters(maze: Maze, distance_field: DistanceField | None = None) -> Dict[str, int]:
+    """Tamanho da população, comprimento inicial do cromossomo e gerações por
+    tentativa, derivados do tamanho do labirinto e da fração de células livres.
+
+    O comprimento parte do número de passos de E até S sem paredes (ou da
+    distância real, se houver campo de distâncias) e cresce com a fração de
+    paredes, que alonga os desvios.
+    """
+    n = maze.n
+    (start_r, start_c), (exit_r, exit_c) = maze.start, maze.exit
+    steps = max(abs(start_r - exit_r), abs(start_c - exit_c))
+    free_ratio = sum(maze.free) / (n * n)
+    length = steps * (1.0 + ADAPTIVE_TORTUOSITY * (1.0 - free_ratio))
+    if distance_field is not None:
+        real = distance_field.distance(start_r, start_c)
+        if real != math.inf:
+            length = real * FIELD_LENGTH_MARGIN
+    length = max(REFERENCE_LENGTH, int(math.ceil(length)))
+    population = min(MAX_POPULATION, max(MIN_POPULATION, int(MIN_POPULATION + 2 * math.sqrt(length))))
+    generations = min(MAX_GENERATIONS, max(MIN_GENERATIONS, 10 * length))
+    return {
+        "population_size": population,
+        "chromosome_length": length,
+        "max_generations": generations,
+    }
+
+
 class GeneticSolver:
     def __init__(
         self,
         maze: Maze,
-        population_size: int = 5,
-        chromosome_length: int = 20,
-        max_generations: int = 200,
+        population_size: int | None = None,
+        chromosome_length: int | None = None,
+        max_generations: int | None = None,
         crossover_rate: float = 0.5,
-        mutation_rate: float = 0.05,
+        mutation_rate: float | None = None,
         tournament_size: int = 3,
         elite_size: int | None = None,
         elite_pool_size: int | None = None,
+        distance_field: DistanceField | None = None,
+        adaptive: bool = False,
+        seed: int | None = None,
     ):
+        """Parâmetros omitidos valem 5 indivíduos, 20 genes, 200 gerações e
+        taxa de mutação 0.05.
+
+        Com `adaptive=True` os omitidos saem de `adaptive_parameters` (e a
+        mutação troca, em média, ADAPTIVE_MUTATIONS genes por filho), os
+        cromossomos podem ganhar e perder genes na mutação e a taxa de
+        mutação sobe quando a população estagna ou perde diversidade.
+
+        Todo sorteio do GA sai do gerador próprio `self.rng`, criado com
+        `seed` (None = semente do sistema): a mesma semente reproduz a mesma
+        execução, sem depender do módulo `random` global nem de outros
+        solvers no mesmo processo.
+        """
         self.maze = maze
+        self.rng = random.Random(seed)
+        # com um campo de distâncias (distfield.py), a aptidão usa a distância
+        # real até a saída no lugar da distância Manhattan
+        self.distance_field = distance_field
+        self.adaptive = adaptive
+        defaults = (
+            adaptive_parameters(maze, distance_field) if adaptive
+            else {"population_size": 5, "chromosome_length": 20, "max_generations": 200}
+        )
+        if population_size is None:
+            population_size = defaults["population_size"]
+        if chromosome_length is None:
+            chromosome_length = defaults["chromosome_length"]
+        if max_generations is None:
+            max_generations = defaults["max_generations"]
+        for name, value in (("population_size", population_size),
+                            ("chromosome_length", chromosome_length),
+                            ("max_generations", max_generations)):
+            if value < 1:
+                raise ValueError(f"{name} deve ser >= 1 (recebido {value})")
         self.population_size = population_size
         self.chromosome_length = chromosome_length
         self.max_generations = max_generations
         self.crossover_rate = crossover_rate
+        if mutation_rate is None:
+            mutation_rate = min(0.05, ADAPTIVE_MUTATIONS / chromosome_length) if adaptive else 0.05
         self.mutation_rate = mutation_rate
+        self.base_mutation_rate = mutation_rate
+        self.max_mutation_rate = max(mutation_rate, min(MAX_MUTATION_RATE, ADAPTIVE_MAX_MUTATIONS / chromosome_length))
+        self.max_chromosome_length = chromosome_length * MAX_LENGTH_FACTOR
+        # largura das linhas da matriz de genes (ver Population)
+        self._width = self.max_chromosome_length if adaptive else chromosome_length
         self.tournament_size = tournament_size
         self.elite_size = elite_size or max(1, population_size // 5)
         if self.elite_size > population_size:
@@ -85,11 +313,127 @@ class GeneticSolver:
             self.elite_pool_size = self.elite_size
         if self.elite_pool_size > population_size:
             self.elite_pool_size = population_size
+        # pesos da aptidão; no modo adaptativo os termos de distância encolhem
+        # com a distância inicial até S e os bônus por passo com o comprimento
+        # do cromossomo, para que nenhum termo sature longe da saída. As
+        # penalidades, que se acumulam sem limite pelo cromossomo inteiro,
+        # encolhem com o quadrado do comprimento e na mesma proporção do ganho
+        # por célula de avanço; senão dominam a aptidão e a busca não sai do
+        # lugar em labirintos grandes
+        scale = dist_scale = 1.0
+        if adaptive:
+            scale = min(1.0, REFERENCE_LENGTH / chromosome_length)
+            field = distance_field.dist if distance_field is not None else None
+            start_dist = self._distance(field, *maze.start)
+            if start_dist != math.inf:
+                dist_scale = min(1.0, (DIST_SCORE_CAP / DISTANCE_PENALTY) / max(start_dist, 1.0))
+        self._distance_penalty = DISTANCE_PENALTY * dist_scale
+        self._progress_reward = PROGRESS_STEP_REWARD * dist_scale
+        penalty_scale = scale * scale * dist_scale
+        self._collision_penalty = COLLISION_PENALTY * penalty_scale
+        self._length_penalty = LENGTH_PENALTY * penalty_scale
+        self._revisit_penalty = REVISIT_PENALTY * penalty_scale
+        self._streak_penalty = COLLISION_STREAK_PENALTY * penalty_scale
+        self._trim_bonus = TRIM_BONUS_PER_GENE * scale
+        self._exploration_bonus = EXPLORATION_STEP_BONUS * scale
+        self._straight_bonus = STRAIGHT_STEP_BONUS * scale
+        # deslocamento de cada gene no mapa linear (com borda) do labirinto
+        self._offsets = gene_offsets(maze.stride)
+        # simulação incremental: resultados da última população avaliada e a
+        # origem (pai, prefixo herdado) de cada indivíduo da próxima
+        self._records: List[_WalkRecord] | None = None
+        self._lineage: Tuple[Population, List[Tuple[int, int] | None]] | None = None
+        # população de duas gerações atrás, reaproveitada como destino da próxima
+        self._spare: Population | None = None
+        self._reset_adaptation()
+        # S alcançável a partir de E (ver `exit_reachable`)
+        self._exit_reachable: bool | None = None
 
     # ------------- Utilidades básicas do GA -------------
 
+    def _random_genes(self, count: int) -> bytes:
+        """`count` genes sorteados de uma vez (um byte aleatório por gene)."""
+        return self.rng.randbytes(count).translate(_GENE_BYTES)
+
     def _random_chromosome(self) -> List[int]:
-        return [random.choice(GENE_VALUES) for _ in range(self.chromosome_length)]
+        return list(self._random_genes(self.chromosome_length))
+
+    def _random_population(self) -> Population:
+        """População aleatória inteira a partir de um único sorteio de bytes."""
+        length = self.chromosome_length
+        population = Population(self.population_size, self._width)
+        genes = memoryview(self._random_genes(length * self.population_size))
+        for i in range(self.population_size):
+            population[i] = genes[i * length:(i + 1) * length]
+        return population
+
+    def _distance(self, field, r: int, c: int):
+        """Distância de (r, c) até a saída usada na aptidão."""
+        if field is None:
+            exit_r, exit_c = self.maze.exit
+            return abs(r - exit_r) + abs(c - exit_c)
+        return field[self.maze.index(r, c)]
+
+    def _score(
+        self,
+        genes: int,
+        dist_exit: float,
+        path_len: int,
+        collisions: int,
+        collision_penalty: float,
+        revisits: int,
+        distinct_cells: int,
+        progress_bonus: float,
+        straight_bonus: float,
+        reached_exit: bool,
+    ) -> float:
+        """Aptidão a partir das estatísticas da caminhada de um cromossomo.
+
+        Compartilhada por `_simulate` e `_evaluate_batch`, para que os dois
+        caminhos produzam exatamente o mesmo valor.
+        """
+        # ----------------- NOVO CÁLCULO DA APTIDÃO -----------------
+        score = 0.0
+
+        # Quanto mais perto da saída, melhor (até 30 pontos)
+        score += max(0.0, DIST_SCORE_CAP - self._distance_penalty * dist_exit)
+
+        # Quanto menos colisões, melhor (até 30 pontos)
+        score += max(0.0, COLLISION_SCORE_CAP - self._collision_penalty * collisions)
+
+        # Caminhos muito longos perdem pontos (até 30 pontos)
+        score += max(0.0, LENGTH_SCORE_CAP - self._length_penalty * path_len)
+
+        # Ganho incremental por reduzir distância passo a passo
+        score += min(progress_bonus, PROGRESS_MAX_BONUS)
+
+        # Bônus por chegar na saída
+        if reached_exit:
+            trimmed_genes = max(0, genes - path_len)
+            score += SUCCESS_BONUS
+            score += trimmed_genes * self._trim_bonus
+
+        repeat_penalty = self._revisit_penalty * revisits
+        score -= repeat_penalty
+        score -= collision_penalty
+
+        # Bônus incremental por explorar novas células e manter direções retas
+        exploration_bonus = min(distinct_cells * self._exploration_bonus, EXPLORATION_MAX_BONUS)
+        score += exploration_bonus
+        score += min(straight_bonus, STRAIGHT_MAX_BONUS)
+
+        if reached_exit:
+            score *= SUCCESS_MULTIPLIER
+
+        # Garante que fique dentro dos limites definidos; no modo adaptativo
+        # valores negativos ficam, para que a seleção (por ordem) ainda
+        # distinga os indivíduos quando todos acumulam muitas penalidades
+        if score < 0.0 and not self.adaptive:
+            score = 0.0
+        elif score > MAX_FITNESS:
+            score = MAX_FITNESS
+        # -------------------------------------------------------------------
+        return score
 
     def _simulate(self, chromosome: List[int]) -> IndividualInfo:
         """Executa o caminho codificado pelo cromossomo e calcula a aptidão."""
@@ -107,30 +451,35 @@ class GeneticSolver:
         last_direction: Tuple[int, int] | None = None
         straight_bonus = 0.0
         progress_bonus = 0.0
-        prev_dist = abs(r - exit_r) + abs(c - exit_c)
+        free = self.maze.free
+        offsets = self._offsets
+        idx = self.maze.index(r, c)
+        field = self.distance_field.dist if self.distance_field is not None else None
+        prev_dist = self._distance(field, r, c)
 
         for gene in chromosome:
-            dr, dc = MOVES[gene]
-            nr, nc = r + dr, c + dc
-            if not self.maze.is_free(nr, nc):
+            nidx = idx + offsets[gene]
+            if not free[nidx]:
                 collisions += 1
                 # bateu na parede -> fica parado
                 collision_streak += 1
-                collision_penalty += COLLISION_STREAK_PENALTY * collision_streak
+                collision_penalty += self._streak_penalty * collision_streak
                 continue
             collision_streak = 0
-            r, c = nr, nc
+            dr, dc = MOVES[gene]
+            idx = nidx
+            r, c = r + dr, c + dc
             visit_counts[(r, c)] += 1
             path.append((r, c))
             visited_cells.add((r, c))
-            current_dist = abs(r - exit_r) + abs(c - exit_c)
+            current_dist = self._distance(field, r, c)
             if current_dist < prev_dist:
-                progress_bonus += PROGRESS_STEP_REWARD * (prev_dist - current_dist)
+                progress_bonus += self._progress_reward * (prev_dist - current_dist)
             prev_dist = current_dist
 
             current_direction = (dr, dc)
             if current_direction == last_direction:
-                straight_bonus += STRAIGHT_STEP_BONUS
+                straight_bonus += self._straight_bonus
             else:
                 last_direction = current_direction
 
@@ -138,75 +487,173 @@ class GeneticSolver:
                 reached_exit = True
                 break
 
-        # ----------------- NOVO CÁLCULO DA APTIDÃO -----------------
-        # distância Manhattan até a saída
-        dist_exit = abs(r - exit_r) + abs(c - exit_c)
+        # distância até a saída (Manhattan, ou real com campo de distâncias)
+        dist_exit = self._distance(field, r, c)
         path_len = len(path) - 1  # número de passos
+        revisits = sum(count - 1 for count in visit_counts.values() if count > 1)
+        fitness = self._score(
+            len(chromosome), dist_exit, path_len, collisions, collision_penalty, revisits,
+            len(visited_cells), progress_bonus, straight_bonus, reached_exit,
+        )
 
-        score = 0.0
-
-        # Quanto mais perto da saída, melhor (até 30 pontos)
-        score += max(0.0, DIST_SCORE_CAP - DISTANCE_PENALTY * dist_exit)
+        return IndividualInfo(
+            chromosome=chromosome[:],
+            path=path,
+            fitness=fitness,
+            reached_exit=reached_exit
+        )
 
-        # Quanto menos colisões, melhor (até 30 pontos)
-        score += max(0.0, COLLISION_SCORE_CAP - COLLISION_PENALTY * collisions)
+    def _evaluate_batch(
+        self,
+        population: Population,
+        lineage: List[Tuple[int, int] | None] | None = None,
+    ) -> None:
+        """Calcula a aptidão de toda a população de uma vez, preenchendo
+        `population.fitness` e `population.reached`.
 
-        # Caminhos muito longos perdem pontos (até 30 pontos)
-        score += max(0.0, LENGTH_SCORE_CAP - LENGTH_PENALTY * path_len)
+        Equivalente a chamar `_simulate` em cada cromossomo, mas caminha pelo
+        mapa linear do labirinto, lendo os genes direto da matriz, e não monta
+        caminhos nem dicionários de visitas: revisitas saem de
+        (passos + 1) - células distintas.
 
-        # Ganho incremental por reduzir distância passo a passo
-        score += min(progress_bonus, PROGRESS_MAX_BONUS)
+        `lineage[i]`, quando dado, é (índice do pai na população avaliada
+        anteriormente, tamanho do prefixo que o filho herdou intacto). O filho
+        retoma a simulação do último checkpoint do pai dentro desse prefixo,
+        e cópias idênticas (elite) reaproveitam o resultado do pai.
+        """
+        maze = self.maze
+        free = maze.free
+        offsets = self._offsets
+        gene_dr = GENE_DR
+        gene_dc = GENE_DC
+        start_r, start_c = maze.start
+        exit_r, exit_c = maze.exit
+        start_idx = maze.index(start_r, start_c)
+        exit_idx = maze.index(exit_r, exit_c)
+        field = self.distance_field.dist if self.distance_field is not None else None
+        start_dist = self._distance(field, start_r, start_c)
+        score = self._score
+        streak_penalty = self._streak_penalty
+        progress_reward = self._progress_reward
+        straight_step = self._straight_bonus
+        interval = CHECKPOINT_INTERVAL
+        previous = self._records if lineage is not None else None
 
-        # Bônus por chegar na saída
-        if reached_exit:
-            trimmed_genes = max(0, self.chromosome_length - path_len)
-            score += SUCCESS_BONUS
-            score += trimmed_genes * TRIM_BONUS_PER_GENE
+        genes = population.genes
+        width = population.width
+        lengths = population.lengths
+        fitnesses = population.fitness
+        reached = population.reached
 
-        repeat_penalty = REVISIT_PENALTY * sum(count - 1 for count in visit_counts.values() if count > 1)
-        score -= repeat_penalty
-        score -= collision_penalty
+        records: List[_WalkRecord] = []
+        for i in range(population.size):
+            length = lengths[i]
+            base = i * width
+            origin = lineage[i] if previous is not None else None
+            if origin is None:
+                begin = 0
+                idx = start_idx
+                r, c = start_r, start_c
+                steps = 0
+                collisions = 0
+                collision_streak = 0
+                collision_penalty = 0.0
+                last_gene = 0
+                straight_bonus = 0.0
+                progress_bonus = 0.0
+                prev_dist = start_dist
+                trace = array('i')
+                checkpoints = []
+                visited = {idx}
+            else:
+                parent = previous[origin[0]]
+                shared = origin[1]
+                if shared >= parent.walked and length == parent.genes:
+                    # mesma caminhada do pai (cópia da elite, ou só mudou depois da saída)
+                    records.append(parent)
+                    fitnesses[i] = parent.fitness
+                    reached[i] = parent.reached_exit
+                    continue
+                k = min(shared // interval, len(parent.checkpoints) - 1)
+                begin = k * interval
+                (idx, r, c, steps, collisions, collision_streak, collision_penalty,
+                 last_gene, straight_bonus, progress_bonus, prev_dist) = parent.checkpoints[k]
+                trace = parent.trace[:steps]
+                checkpoints = parent.checkpoints[:k]
+                visited = set(trace)
+                visited.add(start_idx)
 
-        # Bônus incremental por explorar novas células e manter direções retas
-        exploration_bonus = min(len(visited_cells) * EXPLORATION_STEP_BONUS, EXPLORATION_MAX_BONUS)
-        score += exploration_bonus
-        score += min(straight_bonus, STRAIGHT_MAX_BONUS)
+            reached_exit = False
+            walked = length
+            # posições absolutas na matriz: o gene k do cromossomo fica em base + k
+            next_checkpoint = base + begin
+            for pos in range(base + begin, base + length):
+                if pos == next_checkpoint:
+                    checkpoints.append((
+                        idx, r, c, steps, collisions, collision_streak, collision_penalty,
+                        last_gene, straight_bonus, progress_bonus, prev_dist,
+                    ))
+                    next_checkpoint += interval
+                gene = genes[pos]
+                nidx = idx + offsets[gene]
+                if not free[nidx]:
+                    collisions += 1
+                    collision_streak += 1
+                    collision_penalty += streak_penalty * collision_streak
+                    continue
+                collision_streak = 0
+                idx = nidx
+                r += gene_dr[gene]
+                c += gene_dc[gene]
+                steps += 1
+                trace.append(idx)
+                visited.add(idx)
+                if field is None:
+                    current_dist = abs(r - exit_r) + abs(c - exit_c)
+                else:
+                    current_dist = field[idx]
+                if current_dist < prev_dist:
+                    progress_bonus += progress_reward * (prev_dist - current_dist)
+                prev_dist = current_dist
 
-        if reached_exit:
-            score *= SUCCESS_MULTIPLIER
+                if gene == last_gene:
+                    straight_bonus += straight_step
+                else:
+                    last_gene = gene
 
-        # Garante que fique dentro dos limites definidos
-        if score < 0.0:
-            score = 0.0
-        elif score > MAX_FITNESS:
-            score = MAX_FITNESS
+                if idx == exit_idx:
+                    reached_exit = True
+                    walked = pos - base + 1
+                    break
 
-        fitness = score
-        # -------------------------------------------------------------------
+            fitness = score(
+                length, prev_dist, steps, collisions, collision_penalty, steps + 1 - len(visited),
+                len(visited), progress_bonus, straight_bonus, reached_exit,
+            )
+            records.append(_WalkRecord(fitness, reached_exit, walked, length, checkpoints, trace))
+            fitnesses[i] = fitness
+            reached[i] = reached_exit
 
-        return IndividualInfo(
-            chromosome=chromosome[:],
-            path=path,
-            fitness=fitness,
-            reached_exit=reached_exit
-        )
+        self._records = records
 
-    def _evaluate_population(self, population: List[List[int]]):
-        infos: List[IndividualInfo] = []
-        best_idx = 0
-        best_fit = -math.inf
-        exit_found = False
+    def _evaluate_population(self, population: Population) -> Tuple[int, bool]:
+        """Avalia a população e devolve o índice do melhor e se alguém chegou em S.
 
-        for i, chrom in enumerate(population):
-            info = self._simulate(chrom)
-            infos.append(info)
-            if info.fitness > best_fit:
-                best_fit = info.fitness
-                best_idx = i
-            if info.reached_exit:
-                exit_found = True
+        Os caminhos não são montados: só o de quem for impresso ou devolvido
+        (ver `_path_of`).
+        """
+        lineage = None
+        if self._lineage is not None and self._lineage[0] is population:
+            lineage = self._lineage[1]
+        self._lineage = None
+        self._evaluate_batch(population, lineage)
+        return population.best(), any(population.reached)
 
-        return infos, best_idx, exit_found
+    def _path_of(self, info: IndividualInfo) -> List[Tuple[int, int]]:
+        """Materializa (e guarda) o caminho de um indivíduo avaliado em lote."""
+        if info.path is None:
+            info.path = self._simulate(info.chromosome).path
+        return info.path
 
     # def _tournament_select(self, infos: List[IndividualInfo]) -> IndividualInfo:
     #     best = None
@@ -216,32 +663,219 @@ class GeneticSolver:
     #             best = cand
     #     return best
 
-    def _next_generation(self, infos: List[IndividualInfo]) -> List[List[int]]: # sem torneio, utiliza elitismo
-        elites = sorted(infos, key=lambda inf: inf.fitness, reverse=True)
-        new_pop = [elite.chromosome[:] for elite in elites[:self.elite_size]]
+    def _next_generation(self, population: Population, timings: Dict[str, float] | None = None) -> Population: # sem torneio, utiliza elitismo
+        """Elitismo + cruzamento entre sorteados do grupo de elite.
+
+        Só o grupo de elite é ordenado (`Population.ranked`), e a nova
+        geração é escrita na população de duas gerações atrás, que não é
+        mais usada; a atual passa a ser a reserva.
 
-        while len(new_pop) < self.population_size:
-            p1, p2 = random.sample(elites[:self.elite_pool_size], 2)
-            c1, c2 = self._crossover(p1.chromosome, p2.chromosome)
-            self._mutate(c1); self._mutate(c2)
-            new_pop.append(c1)
-            if len(new_pop) < self.population_size:
-                new_pop.append(c2)
+        Com `timings` (ver metrics.STAGES) o tempo de seleção, cruzamento e
+        mutação é somado ali; sem ele, nenhum relógio é consultado.
+        """
+        timed = timings is not None
+        if timed:
+            t0 = perf_counter()
+        new_pop = self._spare
+        if new_pop is None or new_pop is population or (new_pop.size, new_pop.width) != (self.population_size, self._width):
+            new_pop = Population(self.population_size, self._width)
+        self._spare = population
+        order = population.ranked(self.elite_pool_size)
+        elites = order[:self.elite_size]
+        for k, i in enumerate(elites):
+            new_pop.copy_row(k, population, i)
+        # de quem cada novo indivíduo herdou o prefixo (ver `_evaluate_batch`)
+        lineage: List[Tuple[int, int] | None] = [(i, population.lengths[i]) for i in elites]
+        if timed:
+            timings["selecao"] += perf_counter() - t0
+
+        # o pai de cada filho e o ponto de corte
+        parents: List[int] = []
+        points: List[int] = []
+        sample = self.rng.sample
+        first_child = len(elites)
+        k = first_child
+        while k < self.population_size:
+            if timed:
+                t0 = perf_counter()
+            i1, i2 = sample(order, 2)
+            if timed:
+                t1 = perf_counter()
+                timings["selecao"] += t1 - t0
+            point = self._crossover(population, i1, i2, new_pop, k)
+            if timed:
+                timings["cruzamento"] += perf_counter() - t1
+            parents.append(i1)
+            points.append(point)
+            k += 1
+            if k < self.population_size:
+                parents.append(i2)
+                points.append(point)
+                k += 1
+
+        if timed:
+            t0 = perf_counter()
+        firsts = self._mutate_all(new_pop, first_child)
+        if timed:
+            timings["mutacao"] += perf_counter() - t0
+        lineage.extend((parent, min(point, first)) for parent, point, first in zip(parents, points, firsts))
 
+        self._lineage = (new_pop, lineage)
         return new_pop
 
-    def _crossover(self, p1: List[int], p2: List[int]):
-        if random.random() > self.crossover_rate:
-            return p1[:], p2[:]
-        point = random.randint(1, self.chromosome_length - 1)
-        c1 = p1[:point] + p2[point:]
-        c2 = p2[:point] + p1[point:]
-        return c1, c2
+    def _crossover(self, population: Population, i1: int, i2: int, children: Population, k: int) -> int:
+        """Cruzamento de um ponto entre os pais `i1` e `i2` de `population`.
+
+        Os filhos são escritos nas posições k e k + 1 de `children` (só o
+        primeiro, se k for a última). Devolve o ponto de corte (o tamanho
+        do primeiro pai quando não há cruzamento).
+
+        Com pais de tamanhos diferentes (modo adaptativo) o corte fica dentro
+        do menor, e cada filho herda o tamanho do pai que cede a cauda.
+        """
+        len1 = population.lengths[i1]
+        len2 = population.lengths[i2]
+        second = k + 1 < children.size
+        if self.rng.random() > self.crossover_rate or min(len1, len2) < 2:
+            children.copy_row(k, population, i1)
+            if second:
+                children.copy_row(k + 1, population, i2)
+            return len1
+        point = self.rng.randint(1, min(len1, len2) - 1)
+        src = population.view
+        base1 = i1 * population.width
+        base2 = i2 * population.width
+        genes = children.genes
+        width = children.width
+        dst = k * width
+        genes[dst:dst + point] = src[base1:base1 + point]
+        genes[dst + point:dst + len2] = src[base2 + point:base2 + len2]
+        children.lengths[k] = len2
+        if second:
+            dst += width
+            genes[dst:dst + point] = src[base2:base2 + point]
+            genes[dst + point:dst + len1] = src[base1 + point:base1 + len1]
+            children.lengths[k + 1] = len1
+        return point
+
+    def _mutation_positions(self, total: int) -> List[int]:
+        """Posições (em ordem) que sofrem mutação em `total` genes seguidos.
+
+        Cada gene muta com probabilidade `mutation_rate`, de forma
+        independente; em vez de um sorteio por gene, sorteia-se quantos genes
+        são pulados até a próxima mutação (distribuição geométrica), então o
+        custo é proporcional ao número de mutações.
+        """
+        rate = self.mutation_rate
+        if rate <= 0.0:
+            return []
+        if rate >= 1.0:
+            return list(range(total))
+        log_keep = math.log1p(-rate)
+        log = math.log
+        draw = self.rng.random
+        positions = []
+        pos = -1
+        while True:
+            pos += 1 + int(log(1.0 - draw()) / log_keep)
+            if pos >= total:
+                return positions
+            positions.append(pos)
+
+    def _mutate_all(self, population: Population, first: int) -> List[int]:
+        """Mutação gene a gene de todos os filhos da geração de uma vez.
+
+        Os filhos são os indivíduos de `first` em diante; seus genes são
+        tratados como uma sequência só: as posições mutadas e os genes novos
+        saem de dois sorteios em lote. Devolve, para cada filho, a posição do
+        primeiro gene alterado (o tamanho do cromossomo se nenhum mudou).
+
+        No modo adaptativo o cromossomo também pode ganhar um gene novo ou
+        perder um gene (os seguintes andam uma posição), dentro dos limites
+        de comprimento.
+        """
+        genes = population.genes
+        width = population.width
+        lengths = population.lengths
+        firsts = list(lengths[first:])
+        positions = self._mutation_positions(sum(firsts))
+        if positions:
+            new_genes = self._random_genes(len(positions))
+            k = 0
+            begin = 0
+            end = firsts[0]
+            for pos, gene in zip(positions, new_genes):
+                while pos >= end:
+                    k += 1
+                    begin = end
+                    end += lengths[first + k]
+                i = pos - begin
+                genes[(first + k) * width + i] = gene
+                if i < firsts[k]:
+                    firsts[k] = i
+
+        if self.adaptive:
+            rng = self.rng
+            for k in range(len(firsts)):
+                if rng.random() >= LENGTH_MUTATION_RATE:
+                    continue
+                grow = rng.random() < 0.5
+                length = lengths[first + k]
+                base = (first + k) * width
+                if grow and length < self.max_chromosome_length:
+                    pos = rng.randint(0, length)
+                    genes[base + pos + 1:base + length + 1] = genes[base + pos:base + length]
+                    genes[base + pos] = rng.choice(GENE_VALUES)
+                    lengths[first + k] = length + 1
+                    firsts[k] = min(firsts[k], pos)
+                elif not grow and length > MIN_CHROMOSOME_LENGTH:
+                    pos = rng.randrange(length)
+                    genes[base + pos:base + length - 1] = genes[base + pos + 1:base + length]
+                    lengths[first + k] = length - 1
+                    firsts[k] = min(firsts[k], pos)
+        return firsts
+
+    def _reset_adaptation(self) -> None:
+        """Volta à taxa de mutação base (início de cada tentativa)."""
+        self.mutation_rate = self.base_mutation_rate
+        self._attempt_best = -math.inf
+        self._stagnant = 0
 
-    def _mutate(self, chrom: List[int]) -> None:
-        for i in range(len(chrom)):
-            if random.random() < self.mutation_rate:
-                chrom[i] = random.choice(GENE_VALUES)
+    def _adapt_mutation_rate(self, population: Population, best_fitness: float) -> None:
+        """Sobe a taxa de mutação com a estagnação e com a perda de diversidade.
+
+        A cada STAGNATION_WINDOW gerações sem melhora da melhor aptidão a
+        taxa dobra (até `max_mutation_rate`); população com poucos
+        cromossomos distintos também dobra a taxa. Havendo melhora, volta à
+        taxa base.
+        """
+        if best_fitness > self._attempt_best:
+            self._attempt_best = best_fitness
+            self._stagnant = 0
+        else:
+            self._stagnant += 1
+        rate = self.base_mutation_rate
+        if self._stagnant:
+            rate *= 2 ** min(self._stagnant // STAGNATION_WINDOW, 16)
+        if self._diversity(population) < LOW_DIVERSITY:
+            rate *= 2
+        self.mutation_rate = min(self.max_mutation_rate, rate)
+
+    # ------------- Modelo de ilhas -------------
+
+    def _emigrants(self, population: Population, count: int) -> List[bytes]:
+        """Cópias dos `count` melhores cromossomos (a fatia de elite de `_next_generation`)."""
+        return [population[i] for i in population.ranked(count)]
+
+    def _accept_migrants(self, population: Population, migrants: List[bytes]) -> None:
+        """Troca os últimos filhos da população pelos migrantes, preservando a elite."""
+        room = len(population) - self.elite_size
+        lineage = self._lineage[1] if self._lineage is not None and self._lineage[0] is population else None
+        for k, chrom in enumerate(migrants[:room]):
+            population[len(population) - 1 - k] = chrom
+            if lineage is not None:
+                # migrante não tem checkpoints nesta ilha
+                lineage[-1 - k] = None
 
     # def _next_generation(self, infos: List[IndividualInfo]) -> List[List[int]]:
     #     new_pop: List[List[int]] = []
@@ -263,65 +897,310 @@ class GeneticSolver:
         # Formato semelhante ao exemplo: (0,0)(0,1)(1,1)...
         return ''.join(f"({r},{c})" for (r, c) in path)
 
-    def _print_generation(self, gen: int, infos: List[IndividualInfo], only_best: bool = False):
-        print(f"GERACAO: {gen}")
+    def _print_generation(self, gen: int, population: Population, only_best: bool = False):
+        # as linhas (e os caminhos) só são montadas aqui, quando de fato vão
+        # para a tela, e saem numa única escrita em vez de um print por indivíduo
         if only_best:
             # imprime apenas o melhor indivíduo da geração
-            best = max(infos, key=lambda inf: inf.fitness)
-            idx = infos.index(best)
-            chrom_str = ' '.join(str(g) for g in best.chromosome)
-            path_str = self._format_path(best.path)
-            print(f"(Cromossomo {idx}) {chrom_str} - Caminho: {path_str} - Aptidao: {best.fitness:.1f}")
+            chosen = (population.best(),)
         else:
             # imprime toda a população (modo lento)
-            for idx, info in enumerate(infos):
-                chrom_str = ' '.join(str(g) for g in info.chromosome)
-                path_str = self._format_path(info.path)
-                print(f"(Cromossomo {idx}) {chrom_str} - Caminho: {path_str} - Aptidao: {info.fitness:.1f}")
+            chosen = range(len(population))
+        lines = [f"GERACAO: {gen}"]
+        for idx in chosen:
+            chrom = population[idx]
+            chrom_str = ' '.join(map(str, chrom))
+            path_str = self._format_path(self._simulate(chrom).path)
+            lines.append(f"(Cromossomo {idx}) {chrom_str} - Caminho: {path_str} - Aptidao: {population.fitness[idx]:.1f}")
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
+
+    def _emit_generation(self, metrics: GAMetrics, attempt: int, gen: int, population: Population,
+                         best_fitness: float, exit_found: bool, timings: Dict[str, float]) -> None:
+        metrics.on_generation({
+            "tentativa": attempt,
+            "geracao": gen,
+            "melhor": best_fitness,
+            "media": sum(population.fitness) / len(population),
+            "diversidade": self._diversity(population),
+            "saida_encontrada": exit_found,
+            "tempos": timings,
+        })
+
+    @staticmethod
+    def _diversity(population: Population) -> float:
+        """Fração de cromossomos distintos na população (1.0 = todos diferentes)."""
+        return len(set(population)) / len(population)
 
     # ------------- Execução principal -------------
 
-    def run(self, detailed: bool = False, print_interval: int = 10):
+    def exit_reachable(self) -> bool:
+        """S é alcançável a partir de E? Calculado uma vez por solver.
+
+        Com campo de distâncias até S a resposta já está no campo; senão,
+        um preenchimento a partir de E (`Maze.is_reachable`).
         """
-        Executa o Algoritmo Genético ATÉ encontrar a saída S.
+        if self._exit_reachable is None:
+            field = self.distance_field
+            if field is not None and field.target == self.maze.exit:
+                self._exit_reachable = field.distance(*self.maze.start) != math.inf
+            else:
+                self._exit_reachable = self.maze.is_reachable()
+        return self._exit_reachable
+
+    def check_checkpoint(self, state: GACheckpoint) -> None:
+        """Confere se o checkpoint é deste labirinto e desta configuração;
+        ValueError se não for. `run` confere de novo ao retomar."""
+        maze = self.maze
+        if (state.maze_hash, state.start, state.exit) != (maze.content_hash(), maze.start, maze.exit):
+            raise ValueError("Checkpoint gravado para outro labirinto")
+        expected = (self.population_size, self.chromosome_length, self.max_generations, self.adaptive)
+        found = (state.population_size, state.chromosome_length, state.max_generations, state.adaptive)
+        if found != expected:
+            raise ValueError(
+                f"Checkpoint com outra configuração do GA (população, genes, gerações, "
+                f"adaptativo = {found}; este solver usa {expected})"
+            )
+
+    def resume(self, source: str | GACheckpoint, **run_kwargs) -> GAResult:
+        """Continua uma execução a partir de um checkpoint (arquivo ou já lido).
 
-        Retorna (melhor_cromossomo, melhor_caminho, True).
-        Para labirintos solucionáveis, ele não sai do laço enquanto
-        não tiver pelo menos um indivíduo que chega em 'S'.
+        Aceita os mesmos argumentos de `run`; para seguir gravando, passe
+        `checkpoint` de novo (pode ser o mesmo arquivo).
+        """
+        state = load_checkpoint(source) if isinstance(source, str) else source
+        return self.run(resume_from=state, **run_kwargs)
+
+    def run(
+        self,
+        detailed: bool = False,
+        print_interval: int = 10,
+        verbose: bool = True,
+        should_stop: Callable[[], bool] | None = None,
+        metrics: GAMetrics | None = None,
+        min_print_seconds: float = 0.0,
+        time_limit: float | None = None,
+        max_evaluations: int | None = None,
+        stagnation_limit: int | None = None,
+        max_attempts: int | None = None,
+        check_reachable: bool = True,
+        checkpoint: str | CheckpointWriter | None = None,
+        checkpoint_seconds: float = SAVE_SECONDS,
+        resume_from: GACheckpoint | None = None,
+    ) -> GAResult:
         """
+        Executa o Algoritmo Genético até encontrar a saída S ou esgotar um
+        dos limites, e devolve um GAResult com o motivo da parada.
+
+        Sem limites, para labirintos solucionáveis, ele não sai do laço
+        enquanto não tiver pelo menos um indivíduo que chega em 'S' (a cada
+        `max_generations` gerações sem sucesso a população recomeça).
+
+        Antes de tudo, com `check_reachable`, confere se S é alcançável a
+        partir de E; se não for, o GA nem começa (STOP_UNREACHABLE).
+
+        Limites, todos conferidos no início de cada geração:
+        - `should_stop`: cancelamento cooperativo; quando devolve True a
+          execução para (STOP_CANCELLED);
+        - `time_limit`: segundos de relógio desde o início (STOP_DEADLINE);
+        - `max_evaluations`: total de indivíduos avaliados; a geração que
+          passaria do limite não é avaliada (STOP_EVALUATIONS);
+        - `stagnation_limit`: gerações seguidas sem melhorar a melhor
+          aptidão já vista, contando através dos reinícios (STOP_STAGNATION);
+        - `max_attempts`: número de tentativas (STOP_ATTEMPTS).
+        Ao parar sem achar S, o resultado traz o melhor indivíduo visto.
+
+        Com `checkpoint` (caminho ou CheckpointWriter), o estado do GA é
+        gravado no início de uma geração a cada `checkpoint_seconds` segundos
+        (no máximo isso de trabalho se perde se o processo morrer) e também
+        ao parar por um limite; a gravação corre numa thread à parte
+        (checkpoint.py).
+        `resume_from` continua a execução a partir de um checkpoint (ver
+        `resume`), com o mesmo resultado de uma execução sem interrupção.
+        Avaliações, gerações e estagnação seguem os contadores do
+        checkpoint; `time_limit` conta a partir da retomada.
+
+        Com `verbose=False` nada é impresso (uso em processos auxiliares).
+        `metrics` (metrics.py) recebe os eventos de cada geração, com os
+        tempos de cada etapa. `min_print_seconds` > 0 limita a impressão a
+        no máximo uma geração por intervalo (a geração 0 e a que acha S são
+        sempre impressas).
+        """
+        if isinstance(checkpoint, str):
+            # gravador próprio desta execução: fechado (esperando a última
+            # gravação) ao sair
+            writer = CheckpointWriter(checkpoint)
+            try:
+                return self.run(
+                    detailed, print_interval, verbose, should_stop, metrics, min_print_seconds,
+                    time_limit, max_evaluations, stagnation_limit, max_attempts, check_reachable,
+                    writer, checkpoint_seconds, resume_from,
+                )
+            finally:
+                writer.close()
+
+        started = perf_counter()
+        deadline = None if time_limit is None else started + time_limit
         attempt = 0
+        generations = 0
+        evaluations = 0
+        stale = 0
+        best_overall: IndividualInfo | None = None
+        last_print = -math.inf
+        resume = resume_from
+        if resume is not None:
+            self.check_checkpoint(resume)
+            generations = resume.generations
+            evaluations = resume.evaluations
+            stale = resume.stale
+            if resume.best_chromosome is not None:
+                best_overall = IndividualInfo(
+                    chromosome=list(resume.best_chromosome),
+                    path=None,
+                    fitness=resume.best_fitness,
+                    reached_exit=resume.best_reached,
+                )
+        last_saved = started
+        maze_hash = self.maze.content_hash() if checkpoint is not None else ""
 
-        while True:
-            attempt += 1
-            # nova população aleatória a cada tentativa
-            population = [self._random_chromosome() for _ in range(self.population_size)]
-            best_overall: IndividualInfo | None = None
+        def save(population: Population, gen: int) -> None:
+            checkpoint.submit(GACheckpoint(
+                maze_hash=maze_hash,
+                start=self.maze.start,
+                exit=self.maze.exit,
+                population_size=self.population_size,
+                chromosome_length=self.chromosome_length,
+                max_generations=self.max_generations,
+                adaptive=self.adaptive,
+                attempt=attempt,
+                generation=gen,
+                generations=generations,
+                evaluations=evaluations,
+                stale=stale,
+                mutation_rate=self.mutation_rate,
+                attempt_best=self._attempt_best,
+                stagnant=self._stagnant,
+                rng_state=self.rng.getstate(),
+                population=list(population),
+                best_chromosome=bytes(best_overall.chromosome) if best_overall is not None else None,
+                best_fitness=best_overall.fitness if best_overall is not None else 0.0,
+                best_reached=best_overall.reached_exit if best_overall is not None else False,
+            ))
+
+        def stop(population: Population, gen: int, reason: str) -> GAResult:
+            # parada por limite: grava o ponto exato para continuar depois
+            if checkpoint is not None:
+                save(population, gen)
+            return finish(best_overall, False, reason)
+
+        def finish(best: IndividualInfo | None, found: bool, reason: str) -> GAResult:
+            return GAResult(
+                chromosome=best.chromosome if best is not None else [],
+                path=self._path_of(best) if best is not None else [],
+                found=found,
+                reason=reason,
+                attempts=attempt,
+                generations=generations,
+                evaluations=evaluations,
+                elapsed=perf_counter() - started,
+            )
 
-            for gen in range(self.max_generations):
-                infos, best_idx, exit_found = self._evaluate_population(population)
+        if check_reachable and not self.exit_reachable():
+            return finish(None, False, STOP_UNREACHABLE)
 
-                gen_best = infos[best_idx]
-                if best_overall is None or gen_best.fitness > best_overall.fitness:
-                    best_overall = gen_best
+        while max_attempts is None or attempt < max_attempts:
+            if resume is not None:
+                # continua a tentativa do checkpoint, na geração em que parou
+                attempt = resume.attempt
+                first_gen = resume.generation
+                population = Population.from_chromosomes(resume.population, self._width)
+                self.rng.setstate(resume.rng_state)
+                self.mutation_rate = resume.mutation_rate
+                self._attempt_best = resume.attempt_best
+                self._stagnant = resume.stagnant
+                self._records = None
+                self._lineage = None
+                resume = None
+            else:
+                attempt += 1
+                first_gen = 0
+                # nova população aleatória a cada tentativa
+                population = self._random_population()
+                if self.adaptive:
+                    # o modo adaptativo recomeça a partir do melhor já visto
+                    # em vez de jogar fora todo o progresso
+                    self._reset_adaptation()
+                    if best_overall is not None:
+                        population[0] = best_overall.chromosome
+
+            for gen in range(first_gen, self.max_generations):
+                if should_stop is not None and should_stop():
+                    return stop(population, gen, STOP_CANCELLED)
+                if deadline is not None and perf_counter() > deadline:
+                    return stop(population, gen, STOP_DEADLINE)
+                if max_evaluations is not None and evaluations + len(population) > max_evaluations:
+                    return stop(population, gen, STOP_EVALUATIONS)
+                if stagnation_limit is not None and stale >= stagnation_limit:
+                    return stop(population, gen, STOP_STAGNATION)
+                if checkpoint is not None and perf_counter() - last_saved >= checkpoint_seconds:
+                    last_saved = perf_counter()
+                    save(population, gen)
+
+                if metrics is not None:
+                    timings = dict.fromkeys(STAGES, 0.0)
+                    t0 = perf_counter()
+                    best_idx, exit_found = self._evaluate_population(population)
+                    timings["avaliacao"] = perf_counter() - t0
+                else:
+                    timings = None
+                    best_idx, exit_found = self._evaluate_population(population)
+                generations += 1
+                evaluations += len(population)
+
+                best_fitness = population.fitness[best_idx]
+                if best_overall is None or best_fitness > best_overall.fitness:
+                    # cópia: a matriz da população é reaproveitada
+                    best_overall = population.info(best_idx)
+                    stale = 0
+                else:
+                    stale += 1
+                if self.adaptive:
+                    self._adapt_mutation_rate(population, best_fitness)
 
                 # impressão da geração (como antes)
-                if detailed or gen == 0 or gen % print_interval == 0 or exit_found:
-                    self._print_generation(gen, infos, only_best=not detailed)
+                if verbose and (detailed or gen == 0 or gen % print_interval == 0 or exit_found):
+                    now = perf_counter() if min_print_seconds > 0 else 0.0
+                    if gen == 0 or exit_found or now - last_print >= min_print_seconds:
+                        last_print = now
+                        self._print_generation(gen, population, only_best=not detailed)
 
                 # *** CRITÉRIO DE SUCESSO: alguém chegou na saída ***
                 if exit_found:
                     # pega, dentre os que chegaram em S, o de melhor aptidão
-                    best_with_exit = max(
-                        (inf for inf in infos if inf.reached_exit),
-                        key=lambda x: x.fitness,
-                    )
-                    # opcional: você pode imprimir em qual tentativa/geração encontrou
-                    # print(f"Solução encontrada na tentativa {attempt}, geração {gen}")
-                    return best_with_exit.chromosome, best_with_exit.path, True
+                    best_with_exit = population.info(max(
+                        (i for i in range(len(population)) if population.reached[i]),
+                        key=population.fitness.__getitem__,
+                    ))
+                    if metrics is not None:
+                        self._emit_generation(metrics, attempt, gen, population, best_fitness, True, timings)
+                        metrics.on_exit_found({
+                            "tentativa": attempt,
+                            "geracao": gen,
+                            "aptidao": best_with_exit.fitness,
+                            "genes": len(best_with_exit.chromosome),
+                        })
+                    return finish(best_with_exit, True, STOP_FOUND)
 
                 # gera próxima geração normalmente
-                population = self._next_generation(infos)
+                next_population = self._next_generation(population, timings)
+                if metrics is not None:
+                    self._emit_generation(metrics, attempt, gen, population, best_fitness, False, timings)
+                population = next_population
 
             # se chegou aqui, nenhuma solução nesta tentativa -> recomeça
-            print(f"Nenhuma saída encontrada na tentativa {attempt}, reiniciando população...")
-            # volta para o while True e tenta de novo com outra população
\ No newline at end of file
+            if metrics is not None:
+                metrics.on_restart({"tentativa": attempt, "geracoes": self.max_generations})
+            if verbose and (max_attempts is None or attempt < max_attempts):
+                print(f"Nenhuma saída encontrada na tentativa {attempt}, reiniciando população...")
+
+        return finish(best_overall, False, STOP_ATTEMPTS)
@@ -0,0 +1,221 @@
+# islands.py
+# Modelo de ilhas do Algoritmo Genético: subpopulações em processos separados
+# que trocam seus melhores indivíduos periodicamente.
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+import math
+import multiprocessing
+import os
+import queue
+import random
+import time
+
+from maze import Maze
+from genetic import GeneticSolver
+
+TOPOLOGIES = ("anel", "completa")
+
+
+@dataclass
+class IslandResult:
+    chromosome: List[int]
+    path: List[Tuple[int, int]]
+    island: int
+    seed: int
+    generation: int
+
+
+def _neighbors(island: int, islands: int, topology: str) -> List[int]:
+    """Ilhas que recebem os migrantes de `island`."""
+    if islands < 2:
+        return []
+    if topology == "anel":
+        return [(island + 1) % islands]
+    if topology == "completa":
+        return [j for j in range(islands) if j != island]
+    raise ValueError(f"Topologia desconhecida: {topology!r} (use {', '.join(TOPOLOGIES)})")
+
+
+def _island_worker(
+    island: int,
+    seed: int,
+    maze: Maze,
+    solver_kwargs: Dict[str, Any],
+    inbox,
+    outboxes,
+    results,
+    stop_event,
+    interval: int,
+    migrants: int,
+    max_generations: int | None,
+    deadline: float | None,
+    max_evaluations: int | None,
+    stagnation_limit: int | None,
+) -> None:
+    """Laço evolutivo de uma ilha (roda no processo filho).
+
+    Os limites valem por ilha, como em `GeneticSolver.run`: avaliações
+    somadas através dos reinícios e gerações seguidas sem melhorar a melhor
+    aptidão já vista pela ilha.
+    """
+    for q in outboxes:
+        # não segura o término do processo esperando vizinhos lerem a fila
+        q.cancel_join_thread()
+
+    solver = GeneticSolver(maze, seed=seed, **solver_kwargs)
+    population = solver._random_population()
+    gen = 0
+    evaluations = 0
+    best_fitness = -math.inf
+    stale = 0
+    while not stop_event.is_set() and (max_generations is None or gen < max_generations):
+        if deadline is not None and time.time() > deadline:
+            break
+        if max_evaluations is not None and evaluations + len(population) > max_evaluations:
+            break
+        if stagnation_limit is not None and stale >= stagnation_limit:
+            break
+        # migrantes que chegaram desde a última geração. A época conta os
+        # reinícios de quem envia; os de uma época anterior à desta ilha
+        # vêm de uma população que ela já descartou e são ignorados. Uma
+        # vizinha mais adiantada (época maior) já recomeçou, e seus
+        # migrantes entram normalmente.
+        epoch = gen // solver.max_generations
+        arrived: List[bytes] = []
+        while True:
+            try:
+                sent_epoch, chromosomes = inbox.get_nowait()
+            except queue.Empty:
+                break
+            if sent_epoch >= epoch:
+                arrived.extend(chromosomes)
+        if arrived:
+            solver._accept_migrants(population, arrived)
+
+        best_idx, exit_found = solver._evaluate_population(population)
+        evaluations += len(population)
+        if population.fitness[best_idx] > best_fitness:
+            best_fitness = population.fitness[best_idx]
+            stale = 0
+        else:
+            stale += 1
+        if solver.adaptive:
+            solver._adapt_mutation_rate(population, population.fitness[best_idx])
+        if exit_found:
+            best = population.info(max(
+                (i for i in range(len(population)) if population.reached[i]),
+                key=population.fitness.__getitem__,
+            ))
+            path = solver._path_of(best)
+            if path[-1] == maze.exit:
+                stop_event.set()
+                results.put((island, seed, best.chromosome, path, gen))
+                return
+
+        if gen % interval == interval - 1:
+            emigrants = solver._emigrants(population, migrants)
+            for q in outboxes:
+                q.put((epoch, emigrants))
+
+        gen += 1
+        if gen % solver.max_generations == 0:
+            # mesma estratégia de `GeneticSolver.run`: sem saída na época,
+            # recomeça com população aleatória (os migrantes seguem chegando)
+            previous = population
+            population = solver._random_population()
+            if solver.adaptive:
+                # como no `run` adaptativo, o melhor da época segue adiante
+                population[0] = solver._emigrants(previous, 1)[0]
+                solver._reset_adaptation()
+        else:
+            population = solver._next_generation(population)
+
+
+def run_islands(
+    maze: Maze,
+    islands: int | None = None,
+    topology: str = "anel",
+    migration_interval: int = 10,
+    migrants: int = 1,
+    base_seed: int | None = None,
+    max_generations: int | None = None,
+    time_limit: float | None = None,
+    max_evaluations: int | None = None,
+    stagnation_limit: int | None = None,
+    **solver_kwargs,
+) -> IslandResult | None:
+    """Evolui `islands` subpopulações em paralelo, com migração periódica.
+
+    A cada `migration_interval` gerações, cada ilha envia cópias dos seus
+    `migrants` melhores cromossomos às vizinhas definidas por `topology`
+    ("anel" ou "completa"); os migrantes substituem os piores filhos da
+    próxima geração de quem os recebe. Como em `GeneticSolver.run`, cada ilha
+    recomeça com população aleatória a cada `solver.max_generations`
+    gerações sem achar a saída; migrantes de uma época anterior à do reinício
+    de quem os recebe são descartados. Para no primeiro indivíduo que chega
+    em S, ou devolve None se todas as ilhas esgotarem `max_generations`,
+    `time_limit` segundos, `max_evaluations` ou `stagnation_limit` (esses
+    dois por ilha). Se S não for alcançável a partir de E, devolve None sem
+    criar processo nenhum.
+
+    A troca de migrantes depende do escalonamento dos processos, então o
+    resultado não é reproduzível só pela semente (ao contrário de
+    `parallel.run_parallel`).
+    """
+    islands = islands or os.cpu_count() or 1
+    _neighbors(0, 2, topology)  # valida a topologia antes de criar processos
+    if migration_interval < 1:
+        raise ValueError("migration_interval deve ser >= 1")
+    if base_seed is None:
+        base_seed = random.randrange(2 ** 31)
+    if not maze.is_reachable():
+        return None
+    # prazo em relógio de parede, comparável entre processos
+    deadline = None if time_limit is None else time.time() + time_limit
+
+    ctx = multiprocessing.get_context()
+    inboxes = [ctx.Queue() for _ in range(islands)]
+    results = ctx.Queue()
+    stop_event = ctx.Event()
+
+    procs = []
+    for i in range(islands):
+        outboxes = [inboxes[j] for j in _neighbors(i, islands, topology)]
+        p = ctx.Process(
+            target=_island_worker,
+            args=(i, base_seed + i, maze, solver_kwargs, inboxes[i], outboxes,
+                  results, stop_event, migration_interval, migrants, max_generations, deadline,
+                  max_evaluations, stagnation_limit),
+            daemon=True,
+        )
+        p.start()
+        procs.append(p)
+
+    winner: IslandResult | None = None
+    try:
+        while winner is None and any(p.is_alive() for p in procs):
+            try:
+                island, seed, chrom, path, gen = results.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            winner = IslandResult(chromosome=chrom, path=path, island=island, seed=seed, generation=gen)
+        if winner is None:
+            # uma ilha pode ter terminado logo antes da última checagem
+            try:
+                island, seed, chrom, path, gen = results.get_nowait()
+                winner = IslandResult(chromosome=chrom, path=path, island=island, seed=seed, generation=gen)
+            except queue.Empty:
+                pass
+    finally:
+        stop_event.set()
+        for p in procs:
+            p.join(timeout=5)
+            if p.is_alive():
+                p.terminate()
+        for q in inboxes:
+            q.cancel_join_thread()
+            q.close()
+
+    return winner
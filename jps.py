@@ -0,0 +1,191 @@
+# jps.py
+# Jump Point Search: A* com poda de caminhos simétricos para o grid 8-conexo
+# de custo uniforme do labirinto (1 nas ortogonais, sqrt(2) nas diagonais).
+
+from __future__ import annotations
+from array import array
+from typing import Dict, List, Tuple
+import heapq
+import math
+import sys
+import time
+
+from maze import Maze
+from astar import _octile, astar
+from moves import MOVES
+from mazegen import generate
+
+
+def _jump(free, stride: int, node: int, dr: int, dc: int, goal: int) -> int:
+    """Avança de `node` na direção (dr, dc) até o próximo ponto de salto.
+
+    Devolve o índice do ponto de salto ou -1 se bater em parede. Assim como
+    no A*, movimentos diagonais são permitidos mesmo rente a paredes.
+    """
+    step = dr * stride + dc
+    vert = dr * stride
+    while True:
+        if not free[node]:
+            return -1
+        if node == goal:
+            return node
+        if dr and dc:
+            # vizinhos forçados da diagonal
+            if (free[node + vert - dc] and not free[node - dc]) or \
+               (free[node - vert + dc] and not free[node - vert]):
+                return node
+            # a diagonal para se alguma das retas que saem dela achar algo
+            if _jump(free, stride, node + dc, 0, dc, goal) >= 0 or \
+               _jump(free, stride, node + vert, dr, 0, goal) >= 0:
+                return node
+        elif dc:
+            # horizontal
+            if (free[node + stride + dc] and not free[node + stride]) or \
+               (free[node - stride + dc] and not free[node - stride]):
+                return node
+        else:
+            # vertical
+            if (free[node + vert + 1] and not free[node + 1]) or \
+               (free[node + vert - 1] and not free[node - 1]):
+                return node
+        node += step
+
+
+def _directions(free, stride: int, node: int, parent: int) -> List[Tuple[int, int]]:
+    """Direções a explorar a partir de `node`, podadas pela direção de chegada."""
+    if parent < 0:
+        return [(dr, dc) for dr, dc in MOVES.values() if free[node + dr * stride + dc]]
+
+    pr, pc = divmod(parent, stride)
+    r, c = divmod(node, stride)
+    dr = (r > pr) - (r < pr)
+    dc = (c > pc) - (c < pc)
+    vert = dr * stride
+    dirs: List[Tuple[int, int]] = []
+    if dr and dc:
+        if free[node + vert]:
+            dirs.append((dr, 0))
+        if free[node + dc]:
+            dirs.append((0, dc))
+        if free[node + vert + dc]:
+            dirs.append((dr, dc))
+        if not free[node - dc] and free[node + vert - dc]:
+            dirs.append((dr, -dc))
+        if not free[node - vert] and free[node - vert + dc]:
+            dirs.append((-dr, dc))
+    elif dc:
+        if free[node + dc]:
+            dirs.append((0, dc))
+        if not free[node + stride] and free[node + stride + dc]:
+            dirs.append((1, dc))
+        if not free[node - stride] and free[node - stride + dc]:
+            dirs.append((-1, dc))
+    else:
+        if free[node + vert]:
+            dirs.append((dr, 0))
+        if not free[node + 1] and free[node + vert + 1]:
+            dirs.append((dr, 1))
+        if not free[node - 1] and free[node + vert - 1]:
+            dirs.append((dr, -1))
+    return dirs
+
+
+def _expand_path(maze: Maze, parent: array, node: int) -> List[Tuple[int, int]]:
+    """Reconstrói o caminho célula a célula preenchendo os trechos entre pontos de salto."""
+    stride = maze.stride
+    jump_points = [node]
+    node = parent[node]
+    while node >= 0:
+        jump_points.append(node)
+        node = parent[node]
+    jump_points.reverse()
+
+    coords = maze.coords
+    path: List[Tuple[int, int]] = [coords(jump_points[0])]
+    for a, b in zip(jump_points, jump_points[1:]):
+        ar, ac = divmod(a, stride)
+        br, bc = divmod(b, stride)
+        step = ((br > ar) - (br < ar)) * stride + ((bc > ac) - (bc < ac))
+        while a != b:
+            a += step
+            path.append(coords(a))
+    return path
+
+
+def jps(
+    maze: Maze,
+    start: Tuple[int, int],
+    goal: Tuple[int, int],
+    stats: Dict[str, int] | None = None,
+):
+    """Mesmo contrato de `astar.astar`, mas usando Jump Point Search.
+
+    Retorna o caminho de start até goal (lista de coordenadas, célula a
+    célula) ou None. Só os pontos de salto entram na fila de prioridade, o
+    que corta a maior parte das expansões em áreas abertas e corredores.
+    """
+    free = maze.free
+    stride = maze.stride
+    size = len(free)
+    src = maze.index(*start)
+    dst = maze.index(*goal)
+    goal_r, goal_c = divmod(dst, stride)
+
+    g = array('d', [math.inf]) * size
+    parent = array('i', [-1]) * size
+    closed = bytearray(size)
+    push = heapq.heappush
+    pop = heapq.heappop
+
+    g[src] = 0.0
+    open_heap: List[Tuple[float, int]] = [(_octile(start[0] - goal[0], start[1] - goal[1]), src)]
+    expanded = 0
+    path = None
+
+    while open_heap:
+        _, current = pop(open_heap)
+        if closed[current]:
+            continue
+        if current == dst:
+            path = _expand_path(maze, parent, current)
+            break
+        closed[current] = 1
+        expanded += 1
+
+        cr, cc = divmod(current, stride)
+        current_g = g[current]
+        for dr, dc in _directions(free, stride, current, parent[current]):
+            jp = _jump(free, stride, current + dr * stride + dc, dr, dc, dst)
+            if jp < 0 or closed[jp]:
+                continue
+            jr, jc = divmod(jp, stride)
+            tentative_g = current_g + _octile(jr - cr, jc - cc)
+            if tentative_g < g[jp]:
+                g[jp] = tentative_g
+                parent[jp] = current
+                push(open_heap, (tentative_g + _octile(jr - goal_r, jc - goal_c), jp))
+
+    if stats is not None:
+        stats["expanded"] = expanded
+    return path
+
+
+def _benchmark(label: str, maze: Maze) -> None:
+    print(f"{label} ({maze.n}x{maze.n})")
+    for name, search in (("A*", astar), ("JPS", jps)):
+        stats: Dict[str, int] = {}
+        t0 = time.perf_counter()
+        path = search(maze, maze.start, maze.exit, stats=stats)
+        elapsed = time.perf_counter() - t0
+        steps = len(path) - 1 if path else None
+        print(f"  {name:<4} expandidos: {stats['expanded']:>8}  passos: {steps}  tempo: {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    # Comparação de expansões: python jps.py [arquivo_labirinto ...]
+    files = sys.argv[1:] or ["labirinto_100x100.txt"]
+    _benchmark("campo aberto", generate("aberto", 300, wall_ratio=0.0))
+    _benchmark("campo com 20% de paredes", generate("aberto", 300, wall_ratio=0.2))
+    _benchmark("backtracker", generate("backtracker", 301))
+    for path in files:
+        _benchmark(path, Maze.from_file(path))
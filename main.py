@@ -1,49 +1,44 @@
 # main.py
 # Trabalho T2 - Labirinto com Algoritmo Genético + A*.
 
+import argparse
+import os
 import sys
 from typing import List, Tuple
 
 from maze import Maze
 from genetic import GeneticSolver
-from astar import astar
+from astar import astar, bidirectional_astar
+from parallel import run_parallel
+from islands import TOPOLOGIES, run_islands
+from jps import jps
+from distfield import load_distance_field
+from metrics import JsonlMetrics
+from checkpoint import load_checkpoint
+from output import format_path, maze_with_path, write_output
+from prune import fill_dead_ends, graph_search
+
+# buscas do caminho ótimo (--busca); todas com o contrato de `astar`
+SEARCHES = {
+    "astar": astar,
+    "bidirecional": bidirectional_astar,
+    "jps": jps,
+    "grafo": graph_search,
+}
 
 
 def format_path_with_spaces(path: List[Tuple[int, int]]) -> str:
     """Formata caminho como: (0,0) (0,1) (1,1) ..."""
-    return " ".join(f"({r},{c})" for (r, c) in path)
+    return format_path(path)
 
 
-def maze_with_path(maze: Maze, path: List[Tuple[int, int]]):
-    """Devolve uma cópia do labirinto marcando o caminho com '*'.
+def write_output_file(filename: str, maze: Maze, path: List[Tuple[int, int]]):
+    """Grava arquivo de saída no formato pedido no enunciado.
 
-    Mantém o 'E' na origem e o 'S' da saída.
+    A montagem fica em output.py, direto em bytes (mesmo conteúdo que
+    `maze_with_path` linha a linha).
     """
-    grid = maze.clone_grid()
-    if not path:
-        return grid
-
-    # ignora a posição inicial (já marcada com E)
-    for (r, c) in path[1:]:
-        # não mexe na célula da saída original
-        if (r, c) == maze.exit:
-            continue
-        # só altera células livres
-        if grid[r][c] == "0":
-            grid[r][c] = "*"
-
-    return grid
-
-
-def write_output_file(filename: str, maze: Maze, path: List[Tuple[int, int]]):
-    """Grava arquivo de saída no formato pedido no enunciado."""
-    grid = maze_with_path(maze, path)
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(f"{maze.n}\n")
-        for row in grid:
-            f.write(" ".join(row) + "\n")
-        f.write("\n")
-        f.write("Caminho: " + format_path_with_spaces(path) + "\n")
+    write_output(filename, maze, path)
 
 
 def main(argv=None):
@@ -51,44 +46,148 @@ def main(argv=None):
         argv = sys.argv
 
     if len(argv) < 2:
-        print("Uso: python main.py <arquivo_labirinto> [modo]")
+        print("Uso: python main.py <arquivo_labirinto> [modo] [--paralelo N | --ilhas N] [--semente S]")
         print("  modo = rapido (padrão) -> mostra apenas o melhor cromossomo a cada 10 gerações")
         print("  modo = lento           -> mostra todos os cromossomos de cada geração")
+        print("  --paralelo N           -> roda N ilhas independentes do GA em processos separados")
+        print("  --semente S            -> semente do GA (reproduz o vencedor do modo paralelo)")
+        print("  --ilhas N              -> modelo de ilhas: N subpopulações com migração periódica")
+        print("    --topologia T        -> anel (padrão) ou completa")
+        print("    --intervalo K        -> gerações entre migrações (padrão 10)")
+        print("    --migrantes M        -> indivíduos enviados por migração (padrão 1)")
+        print("  --busca B              -> busca do caminho ótimo: astar (padrão), bidirecional, jps")
+        print("                            ou grafo (grafo de junções, sem becos)")
+        print("  --podar                -> emparedar os becos sem saída antes do GA e da busca")
+        print("  --campo                -> usa o campo de distâncias até S (em cache no disco)")
+        print("                            na aptidão do GA e no caminho ótimo")
+        print("  --adaptativo           -> GA adaptativo: população e cromossomo dimensionados pelo")
+        print("                            labirinto, cromossomos de tamanho variável e mutação adaptativa")
+        print("  --metricas ARQ         -> grava as métricas de cada geração do GA em ARQ (JSONL)")
+        print("  --tempo SEGUNDOS       -> tempo máximo do GA")
+        print("  --avaliacoes N         -> máximo de indivíduos avaliados pelo GA")
+        print("  --estagnacao G         -> para o GA após G gerações sem melhorar a aptidão")
+        print("  --checkpoint ARQ       -> grava o estado do GA em ARQ periodicamente")
+        print("    --retomar            -> continua o GA a partir do checkpoint em ARQ")
         return 1
 
-    lab_file = argv[1]
-    mode = argv[2].lower() if len(argv) >= 3 else "rapido"
+    parser = argparse.ArgumentParser(prog="main.py")
+    parser.add_argument("arquivo")
+    parser.add_argument("modo", nargs="?", default="rapido")
+    parser.add_argument("--paralelo", type=int, default=0, metavar="N")
+    parser.add_argument("--semente", type=int, default=None, metavar="S")
+    parser.add_argument("--ilhas", type=int, default=0, metavar="N")
+    parser.add_argument("--topologia", choices=TOPOLOGIES, default="anel")
+    parser.add_argument("--intervalo", type=int, default=10, metavar="K")
+    parser.add_argument("--migrantes", type=int, default=1, metavar="M")
+    parser.add_argument("--busca", choices=tuple(SEARCHES), default="astar")
+    parser.add_argument("--campo", action="store_true")
+    parser.add_argument("--adaptativo", action="store_true")
+    parser.add_argument("--podar", action="store_true")
+    parser.add_argument("--metricas", default=None, metavar="ARQ")
+    parser.add_argument("--tempo", type=float, default=None, metavar="SEGUNDOS")
+    parser.add_argument("--avaliacoes", type=int, default=None, metavar="N")
+    parser.add_argument("--estagnacao", type=int, default=None, metavar="G")
+    parser.add_argument("--checkpoint", default=None, metavar="ARQ")
+    parser.add_argument("--retomar", action="store_true")
+    args = parser.parse_args(argv[1:])
+    if args.retomar and not args.checkpoint:
+        parser.error("--retomar precisa de --checkpoint ARQ")
+    if args.checkpoint and (args.ilhas > 0 or args.paralelo > 0):
+        parser.error("--checkpoint só vale para o GA em um único processo")
+
+    lab_file = args.arquivo
+    mode = args.modo.lower()
     detailed = (mode == "lento")
 
-    maze = Maze.from_file(lab_file)
-    solver = GeneticSolver(maze)
+    maze = Maze.load(lab_file)
+    # GA e busca rodam no labirinto podado; as saídas são desenhadas no original
+    work = fill_dead_ends(maze) if args.podar else maze
+    field = load_distance_field(work) if args.campo else None
+
+    # sem caminho de E até S o GA nunca terminaria: nem começa
+    if not work.is_reachable():
+        print("A saída S não é alcançável a partir da entrada E.")
+        return 1
+
+    # limites do GA (todos opcionais)
+    budgets = {
+        "time_limit": args.tempo,
+        "max_evaluations": args.avaliacoes,
+        "stagnation_limit": args.estagnacao,
+    }
 
     # ----------------- ALGORITMO GENÉTICO -----------------
     print("\n=== ALGORITMO GENÉTICO ===\n")
 
-    max_tentativas = 10
     ga_path: List[Tuple[int, int]] | None = None
-
-    for tentativa in range(1, max_tentativas + 1):
-        print(f"\n--- Tentativa {tentativa} do GA ---\n")
-        chrom, tentativa_path, found_exit = solver.run(
-            detailed=detailed, print_interval=10
+    # motivo da parada do GA, quando ele não chega em S
+    stop_reason: str | None = None
+
+    if args.ilhas > 0:
+        print(f"Executando {args.ilhas} ilhas do GA com migração ({args.topologia}, "
+              f"a cada {args.intervalo} gerações, {args.migrantes} migrante(s))...\n")
+        island_result = run_islands(
+            work, islands=args.ilhas, topology=args.topologia,
+            migration_interval=args.intervalo, migrants=args.migrantes,
+            base_seed=args.semente, time_limit=args.tempo,
+            max_evaluations=args.avaliacoes, stagnation_limit=args.estagnacao,
+            distance_field=field, adaptive=args.adaptativo,
         )
-
-        # Critério REAL de sucesso: caminho termina exatamente na célula S
-        if tentativa_path and tentativa_path[-1] == maze.exit:
-            ga_path = tentativa_path
-            print(f"\nSaída S encontrada na tentativa {tentativa}.\n")
-            break
+        if island_result is not None:
+            ga_path = island_result.path
+            print(f"Saída S encontrada pela ilha {island_result.island} "
+                  f"na geração {island_result.generation}.\n")
         else:
-            print("GA não chegou em S nesta tentativa.\n")
-
-    # Se mesmo depois de várias tentativas não chegou em S, aborta
-    if not ga_path or ga_path[-1] != maze.exit:
-        print(
-            f"\nMesmo após {max_tentativas} tentativas o Algoritmo Genético "
-            "não encontrou a saída S."
+            stop_reason = "nenhuma ilha chegou em S"
+    elif args.paralelo > 0:
+        print(f"Executando {args.paralelo} ilhas do GA em paralelo...\n")
+        result = run_parallel(
+            work, islands=args.paralelo, base_seed=args.semente, run_kwargs=budgets,
+            distance_field=field, adaptive=args.adaptativo,
         )
+        if result is not None:
+            ga_path = result.path
+            print(f"Saída S encontrada pela ilha de semente {result.seed} "
+                  f"(reproduza com --semente {result.seed}).\n")
+        else:
+            stop_reason = "nenhuma ilha chegou em S"
+    else:
+        solver = GeneticSolver(work, distance_field=field, adaptive=args.adaptativo, seed=args.semente)
+        metrics = JsonlMetrics(args.metricas) if args.metricas else None
+        resume_from = None
+        if args.retomar:
+            if os.path.exists(args.checkpoint):
+                try:
+                    resume_from = load_checkpoint(args.checkpoint)
+                    solver.check_checkpoint(resume_from)
+                except ValueError as e:
+                    print(f"Não foi possível retomar de {args.checkpoint}: {e}")
+                    return 1
+                print(f"Retomando o GA do checkpoint {args.checkpoint} (tentativa {resume_from.attempt}, "
+                      f"geração {resume_from.generation}).")
+            else:
+                print(f"Checkpoint {args.checkpoint} não encontrado; o GA começa do zero.")
+
+        try:
+            # o GA reinicia a população sozinho até chegar em S ou esgotar um limite
+            result = solver.run(
+                detailed=detailed, print_interval=10, metrics=metrics,
+                check_reachable=False, checkpoint=args.checkpoint,
+                resume_from=resume_from, **budgets,
+            )
+            # Critério REAL de sucesso: caminho termina exatamente na célula S
+            if result.found and result.path[-1] == maze.exit:
+                ga_path = result.path
+                print(f"\nSaída S encontrada na tentativa {result.attempts}.\n")
+            else:
+                stop_reason = result.reason
+        finally:
+            if metrics is not None:
+                metrics.close()
+
+    # Se o GA parou sem chegar em S, aborta
+    if not ga_path or ga_path[-1] != maze.exit:
+        print(f"\nO Algoritmo Genético parou sem encontrar a saída S ({stop_reason}).")
         return 1
 
     # Aqui temos certeza que o ÚLTIMO ponto do caminho é a saída S
@@ -102,7 +201,12 @@ def main(argv=None):
     print("\n=== ALGORITMO A* ===\n")
     # A saída usada pelo A* é a coordenada final do caminho encontrado pelo GA
     goal = ga_path[-1]
-    a_path = astar(maze, maze.start, goal)
+    if field is not None and goal == field.target:
+        # com o campo pronto, o caminho ótimo é só uma descida de gradiente
+        a_path = field.path_from(work.start)
+    else:
+        search = SEARCHES[args.busca]
+        a_path = search(work, work.start, goal)
 
     if a_path:
         print("Caminho ótimo encontrado pelo A*:")
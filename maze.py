@@ -1,15 +1,87 @@
-
 # maze.py
 # Representação do labirinto e funções auxiliares de E/S.
 
-from typing import List, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
+import hashlib
+import mmap
+import os
+import re
+import struct
+
+# Tabelas de tradução entre os caracteres do arquivo e o mapa de células livres.
+# Qualquer caractere diferente de '1' é transitável (0, E, S).
+_FREE_TABLE = bytes(0 if b == ord('1') else 1 for b in range(256))
+_CHAR_TABLE = bytes(ord('1') if b == 0 else ord('0') for b in range(256))
+_WHITESPACE = b' \t\r\v\f'
+# dois caracteres de célula colados numa linha separada por espaços
+_ADJACENT_RE = re.compile(rb'\S\S')
+# células que não são 0 nem 1 (E, S)
+_MARK_RE = re.compile(rb'[^01]')
+
+# Formato binário: cabeçalho (assinatura, n, entrada, saída, flags) seguido do
+# mapa de paredes com 1 bit por célula (1 = parede), linha a linha, cada linha
+# completada até fechar um byte.
+BINARY_MAGIC = b'LAB1'
+BINARY_HEADER = struct.Struct('<4sIiiiiI')
+_FLAG_START_MARK = 1  # a entrada está marcada com 'E' no labirinto
+
 
 class Maze:
-    def __init__(self, grid: List[List[str]], start: Tuple[int, int], exit_pos: Tuple[int, int]):
-        self.grid = grid
-        self.n = len(grid)
+    """Labirinto n x n guardado como um mapa compacto de células livres.
+
+    O mapa `free` é um `bytearray` de (n + 2) x (n + 2) posições, com uma
+    borda de paredes ao redor do labirinto. Assim, o teste de vizinho de
+    qualquer célula interna é um único acesso por índice, sem checagem de
+    limites. A célula (r, c) fica no índice `(r + 1) * stride + (c + 1)`.
+
+    A forma lista-de-listas (`clone_grid`) só é montada sob demanda, para
+    impressão e arquivos de saída.
+    """
+
+    def __init__(self, grid: Sequence[Sequence[str]], start: Tuple[int, int], exit_pos: Tuple[int, int]):
+        n = len(grid)
+        stride = n + 2
+        free = bytearray(stride * stride)
+        marks: Dict[Tuple[int, int], str] = {}
+        for i, row in enumerate(grid):
+            line = ''.join(row).encode('utf-8')
+            if len(line) != n or line.translate(None, b'01'):
+                # marcadores (E, S) são guardados à parte para reproduzir a saída
+                line = bytes(49 if ch == '1' else 48 for ch in row)
+                for j, ch in enumerate(row):
+                    if ch != '0' and ch != '1':
+                        marks[(i, j)] = ch
+            base = (i + 1) * stride + 1
+            free[base:base + n] = line.translate(_FREE_TABLE)
+        self._setup(n, free, start, exit_pos, marks)
+
+    @classmethod
+    def from_bitmap(
+        cls,
+        n: int,
+        free: bytearray,
+        start: Tuple[int, int],
+        exit_pos: Tuple[int, int],
+        marks: Optional[Dict[Tuple[int, int], str]] = None,
+    ) -> "Maze":
+        """Cria o labirinto direto a partir de um mapa de células livres já com borda."""
+        if len(free) != (n + 2) * (n + 2):
+            raise ValueError(f"Mapa com {len(free)} posições, esperado {(n + 2) * (n + 2)}")
+        maze = cls.__new__(cls)
+        maze._setup(n, free, start, exit_pos, marks)
+        return maze
+
+    def _setup(self, n, free, start, exit_pos, marks):
+        self.n = n
+        self.stride = n + 2
+        self.free = free
         self.start = start
         self.exit = exit_pos
+        if marks is None:
+            marks = {exit_pos: 'S'}
+            if self.is_inside(*start):
+                marks[start] = 'E'
+        self.marks = marks
 
     @classmethod
     def from_file(cls, path: str) -> "Maze":
@@ -19,55 +91,262 @@ class Maze:
         - primeira linha: inteiro n (tamanho da matriz n x n)
         - próximas n linhas: caracteres separados por espaço OU colados
           ('E', 'S', '0', '1').
+
+        O arquivo é mapeado em memória (mmap) e decodificado linha a linha
+        direto para o mapa de células livres, sem montar listas de caracteres.
         """
-        with open(path, 'r', encoding='utf-8') as f:
-            first = f.readline()
-            if not first:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
                 raise ValueError("Arquivo vazio")
-            first = first.strip()
-            if not first:
-                # permite linha em branco antes do número
-                first = f.readline().strip()
-            n = int(first)
-            grid: List[List[str]] = []
-            start = None
-            exit_pos = None
-
-            for i in range(n):
-                line = f.readline()
-                if line is None or line == "":
-                    raise ValueError(f"Fim do arquivo antes de ler a linha {i+1} do labirinto")
-                line = line.strip()
-                if not line:
-                    # permite linhas vazias extras
-                    i -= 1
-                    continue
-                tokens = line.split()
-                if len(tokens) == 1 and len(tokens[0]) == n:
-                    row = list(tokens[0])
-                else:
-                    row = tokens
-                if len(row) != n:
-                    raise ValueError(f"Linha {i+1} deveria ter {n} colunas, mas tem {len(row)}: {row}")
-                for j, c in enumerate(row):
-                    if c == 'E':
-                        start = (i, j)
-                    elif c == 'S':
-                        exit_pos = (i, j)
-                grid.append(row)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return cls.from_bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data) -> "Maze":
+        """Lê um labirinto no formato texto a partir de um buffer de bytes
+        (bytes, bytearray, memoryview ou mmap). Ver `from_file`."""
+        size = len(data)
+        pos = 0
+
+        def next_line() -> bytes | None:
+            nonlocal pos
+            if pos >= size:
+                return None
+            end = data.find(b'\n', pos)
+            if end < 0:
+                end = size
+            line = data[pos:end]
+            pos = end + 1
+            return line
+
+        first = next_line()
+        if first is None:
+            raise ValueError("Arquivo vazio")
+        first = first.strip()
+        if not first:
+            # permite linha em branco antes do número
+            first = (next_line() or b'').strip()
+        n = int(first.decode('utf-8'))
+
+        stride = n + 2
+        free = bytearray(stride * stride)
+        marks: Dict[Tuple[int, int], str] = {}
+        start = None
+        exit_pos = None
+
+        i = 0
+        while i < n:
+            line = next_line()
+            if line is None:
+                raise ValueError(f"Fim do arquivo antes de ler a linha {i+1} do labirinto")
+            line = line.strip()
+            if not line:
+                # permite linhas vazias extras
+                continue
+            row = cls._decode_row(line, n, i)
+            base = (i + 1) * stride + 1
+            free[base:base + n] = row.translate(_FREE_TABLE)
+            if row.translate(None, b'01'):
+                # só linhas com marcadores (E, S) são percorridas em Python
+                for j in _MARK_RE.finditer(row):
+                    ch = j.group().decode('utf-8')
+                    c = j.start()
+                    marks[(i, c)] = ch
+                    if ch == 'E':
+                        start = (i, c)
+                    elif ch == 'S':
+                        exit_pos = (i, c)
+            i += 1
 
         if start is None:
             start = (0, 0)
         if exit_pos is None:
             raise ValueError("Saída 'S' não encontrada no labirinto")
-        return cls(grid, start, exit_pos)
+        return cls.from_bitmap(n, free, start, exit_pos, marks)
+
+    @classmethod
+    def load(cls, path: str) -> "Maze":
+        """Lê um labirinto no formato texto ou binário (detectado pela assinatura)."""
+        with open(path, 'rb') as f:
+            magic = f.read(len(BINARY_MAGIC))
+        if magic == BINARY_MAGIC:
+            return cls.load_binary(path)
+        return cls.from_file(path)
+
+    @classmethod
+    def load_binary(cls, path: str) -> "Maze":
+        """Lê um labirinto gravado por `save_binary` (via mmap)."""
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError("Arquivo vazio")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return cls.from_binary(data)
+
+    @classmethod
+    def from_binary(cls, data) -> "Maze":
+        """Decodifica o formato binário a partir de um buffer de bytes."""
+        if len(data) < BINARY_HEADER.size or data[:len(BINARY_MAGIC)] != BINARY_MAGIC:
+            raise ValueError("Arquivo não está no formato binário de labirinto")
+        _, n, start_r, start_c, exit_r, exit_c, flags = BINARY_HEADER.unpack_from(data, 0)
+        row_bytes = (n + 7) // 8
+        expected = BINARY_HEADER.size + n * row_bytes
+        if len(data) < expected:
+            raise ValueError(f"Arquivo binário truncado: {len(data)} bytes, esperado {expected}")
+
+        stride = n + 2
+        free = bytearray(stride * stride)
+        bits_fmt = f'0{row_bytes * 8}b'
+        pos = BINARY_HEADER.size
+        for r in range(n):
+            bits = format(int.from_bytes(data[pos:pos + row_bytes], 'big'), bits_fmt)
+            base = (r + 1) * stride + 1
+            free[base:base + n] = bits[:n].encode('ascii').translate(_FREE_TABLE)
+            pos += row_bytes
+
+        start = (start_r, start_c)
+        exit_pos = (exit_r, exit_c)
+        for name, (r, c) in (("Entrada", start), ("Saída", exit_pos)):
+            if not (0 <= r < n and 0 <= c < n):
+                raise ValueError(f"{name} ({r},{c}) fora do labirinto {n}x{n} no arquivo binário")
+        marks = {exit_pos: 'S'}
+        if flags & _FLAG_START_MARK:
+            marks[start] = 'E'
+        return cls.from_bitmap(n, free, start, exit_pos, marks)
+
+    def save_binary(self, path: str) -> None:
+        """Grava o labirinto no formato binário compacto (1 bit por célula).
+
+        Só a entrada e a saída são guardadas como marcadores; as demais
+        células viram 0 ou 1.
+        """
+        n, stride, free = self.n, self.stride, self.free
+        row_bytes = (n + 7) // 8
+        padding = b'0' * (row_bytes * 8 - n)
+        flags = _FLAG_START_MARK if self.marks.get(self.start) == 'E' else 0
+        with open(path, 'wb') as f:
+            f.write(BINARY_HEADER.pack(BINARY_MAGIC, n, *self.start, *self.exit, flags))
+            for r in range(n):
+                base = (r + 1) * stride + 1
+                bits = free[base:base + n].translate(_CHAR_TABLE) + padding
+                f.write(int(bits, 2).to_bytes(row_bytes, 'big'))
+
+    def save_text(self, path: str) -> None:
+        """Grava o labirinto no formato texto do enunciado (células separadas por espaço)."""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"{self.n}\n")
+            for row in self.clone_grid():
+                f.write(" ".join(row) + "\n")
+
+    @staticmethod
+    def _decode_row(line: bytes, n: int, i: int) -> bytes:
+        """Converte uma linha (já sem espaços nas pontas) em n bytes de célula."""
+        if line.isascii():
+            compact = line.translate(None, _WHITESPACE)
+            if len(compact) == n and (len(compact) == len(line) or not _ADJACENT_RE.search(line)):
+                # formato colado, ou separado por espaços com um caractere por célula
+                return compact
+
+        # caso geral (tokens com mais de um caractere, linhas inválidas):
+        # mesmas regras e mensagens do leitor original
+        tokens = line.decode('utf-8').split()
+        if len(tokens) == 1 and len(tokens[0]) == n:
+            row = list(tokens[0])
+        else:
+            row = tokens
+        if len(row) != n:
+            raise ValueError(f"Linha {i+1} deveria ter {n} colunas, mas tem {len(row)}: {row}")
+        # tokens de vários caracteres (livres, como no leitor original) viram '?'
+        return b''.join(tok.encode('ascii') if len(tok) == 1 and tok.isascii() else b'?' for tok in row)
+
+    def content_hash(self) -> str:
+        """Hash (SHA-256) do conteúdo do labirinto: tamanho e células livres.
+
+        Não depende de entrada e saída, então serve de chave para dados
+        derivados só das paredes.
+        """
+        h = hashlib.sha256()
+        h.update(self.n.to_bytes(8, 'little'))
+        h.update(self.free)
+        return h.hexdigest()
+
+    def index(self, r: int, c: int) -> int:
+        """Índice linear da célula (r, c) no mapa com borda."""
+        return (r + 1) * self.stride + c + 1
+
+    def coords(self, idx: int) -> Tuple[int, int]:
+        """Inverso de `index`: devolve (r, c) a partir do índice linear."""
+        r, c = divmod(idx, self.stride)
+        return r - 1, c - 1
 
     def is_inside(self, r: int, c: int) -> bool:
         return 0 <= r < self.n and 0 <= c < self.n
 
     def is_free(self, r: int, c: int) -> bool:
-        """Retorna True se a célula é transitável (0, E ou S)."""
-        return self.is_inside(r, c) and self.grid[r][c] != '1'
+        """Retorna True se a célula é transitável (0, E ou S); False fora do labirinto."""
+        return 0 <= r < self.n and 0 <= c < self.n and self.free[(r + 1) * self.stride + c + 1] == 1
+
+    def is_reachable(self, start: Optional[Tuple[int, int]] = None, goal: Optional[Tuple[int, int]] = None) -> bool:
+        """Retorna True se `goal` (padrão: a saída) é alcançável a partir de
+        `start` (padrão: a entrada) andando nas 8 direções.
+
+        Preenchimento simples a partir de `start`, sem custos nem fila de
+        prioridade: é a checagem barata feita antes de rodar o GA.
+        """
+        if start is None:
+            start = self.start
+        if goal is None:
+            goal = self.exit
+        if not (self.is_inside(*start) and self.is_inside(*goal)):
+            return False
+        src = self.index(*start)
+        dst = self.index(*goal)
+        # células livres ainda não alcançadas
+        open_cells = bytearray(self.free)
+        if not open_cells[src] or not open_cells[dst]:
+            return False
+        stride = self.stride
+        offsets = (-stride - 1, -stride, -stride + 1, -1, 1, stride - 1, stride, stride + 1)
+        open_cells[src] = 0
+        stack = [src]
+        while stack:
+            node = stack.pop()
+            for offset in offsets:
+                neighbor = node + offset
+                if open_cells[neighbor]:
+                    if neighbor == dst:
+                        return True
+                    open_cells[neighbor] = 0
+                    stack.append(neighbor)
+        return src == dst
 
-    def clone_grid(self):
-        return [row[:] for row in self.grid]
+    def cell_bytes(self) -> Optional[bytearray]:
+        """Células do labirinto como n*n bytes ASCII ('0', '1', 'E', 'S'...), linha a linha.
+
+        Devolve None se alguma marca não couber em um byte (caractere não
+        ASCII vindo de uma grade em lista); aí só `clone_grid` representa
+        o labirinto fielmente.
+        """
+        n, stride, free = self.n, self.stride, self.free
+        cells = bytearray(n * n)
+        for r in range(n):
+            base = (r + 1) * stride + 1
+            cells[r * n:(r + 1) * n] = free[base:base + n].translate(_CHAR_TABLE)
+        for (r, c), ch in self.marks.items():
+            if len(ch) != 1 or ord(ch) > 127:
+                return None
+            cells[r * n + c] = ord(ch)
+        return cells
+
+    def clone_grid(self) -> List[List[str]]:
+        """Labirinto como lista de listas de caracteres, montada a cada chamada.
+
+        É uma cópia: alterá-la não muda o labirinto (o estado fica em `free`).
+        """
+        n, stride, free = self.n, self.stride, self.free
+        grid = []
+        for r in range(n):
+            base = (r + 1) * stride + 1
+            grid.append(list(free[base:base + n].translate(_CHAR_TABLE).decode('ascii')))
+        for (r, c), ch in self.marks.items():
+            grid[r][c] = ch
+        return grid
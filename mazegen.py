@@ -0,0 +1,136 @@
+# mazegen.py
+# Gerador de labirintos reproduzível (por semente), para testes de desempenho.
+
+from __future__ import annotations
+from typing import Tuple
+import random
+import sys
+
+from maze import Maze
+
+KINDS = ("backtracker", "aleatorio", "aberto")
+
+
+def _empty_bitmap(n: int, fill: int) -> bytearray:
+    """Mapa com borda de paredes e o interior todo com `fill` (0 = parede, 1 = livre)."""
+    stride = n + 2
+    free = bytearray(stride * stride)
+    if fill:
+        row = b'\x01' * n
+        for r in range(n):
+            base = (r + 1) * stride + 1
+            free[base:base + n] = row
+    return free
+
+
+def _backtracker(n: int, rng: random.Random) -> Tuple[bytearray, Tuple[int, int], Tuple[int, int]]:
+    """Labirinto perfeito pelo algoritmo de backtracking recursivo (versão iterativa).
+
+    As "salas" ficam nas coordenadas pares; entre duas salas vizinhas há uma
+    célula que vira passagem quando o algoritmo as conecta.
+    """
+    stride = n + 2
+    free = _empty_bitmap(n, 0)
+    rooms = (n + 1) // 2
+    seen = bytearray(rooms * rooms)
+
+    def carve(r: int, c: int) -> None:
+        free[(r + 1) * stride + c + 1] = 1
+
+    carve(0, 0)
+    seen[0] = 1
+    stack = [(0, 0)]
+    while stack:
+        r, c = stack[-1]
+        options = []
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < rooms and 0 <= nc < rooms and not seen[nr * rooms + nc]:
+                options.append((nr, nc))
+        if not options:
+            stack.pop()
+            continue
+        nr, nc = rng.choice(options)
+        seen[nr * rooms + nc] = 1
+        carve(r + nr, c + nc)  # parede entre as duas salas
+        carve(2 * nr, 2 * nc)
+        stack.append((nr, nc))
+
+    last = 2 * (rooms - 1)
+    return free, (0, 0), (last, last)
+
+
+def _random_walls(n: int, rng: random.Random, wall_ratio: float) -> Tuple[bytearray, Tuple[int, int], Tuple[int, int]]:
+    """Paredes sorteadas célula a célula, com um caminho garantido até a saída."""
+    stride = n + 2
+    free = _empty_bitmap(n, 0)
+    for r in range(n):
+        base = (r + 1) * stride + 1
+        free[base:base + n] = bytes(rng.random() >= wall_ratio for _ in range(n))
+
+    # passeio aleatório monotônico de (0,0) a (n-1,n-1) para garantir a solução
+    r = c = 0
+    free[stride + 1] = 1
+    while (r, c) != (n - 1, n - 1):
+        dr, dc = rng.choice(((1, 0), (0, 1), (1, 1)))
+        r = min(r + dr, n - 1)
+        c = min(c + dc, n - 1)
+        free[(r + 1) * stride + c + 1] = 1
+    return free, (0, 0), (n - 1, n - 1)
+
+
+def _open_field(n: int, rng: random.Random, wall_ratio: float) -> Tuple[bytearray, Tuple[int, int], Tuple[int, int]]:
+    """Campo aberto com poucas paredes soltas; a saída fica fora da diagonal."""
+    stride = n + 2
+    free = _empty_bitmap(n, 1)
+    for _ in range(int(n * n * wall_ratio)):
+        free[(rng.randrange(n) + 1) * stride + rng.randrange(n) + 1] = 0
+    start, exit_pos = (0, 0), (n - 1, n // 3)
+    free[(start[0] + 1) * stride + start[1] + 1] = 1
+    free[(exit_pos[0] + 1) * stride + exit_pos[1] + 1] = 1
+    return free, start, exit_pos
+
+
+def generate(kind: str, n: int, seed: int = 0, wall_ratio: float | None = None) -> Maze:
+    """Gera um labirinto n x n do tipo `kind` ("backtracker", "aleatorio" ou "aberto").
+
+    A mesma semente sempre gera o mesmo labirinto. `wall_ratio` é a fração
+    de paredes nos tipos "aleatorio" (padrão 0.3) e "aberto" (padrão 0.05).
+    """
+    if n < 2:
+        raise ValueError("n deve ser >= 2")
+    rng = random.Random(seed)
+    if kind == "backtracker":
+        free, start, exit_pos = _backtracker(n, rng)
+    elif kind == "aleatorio":
+        free, start, exit_pos = _random_walls(n, rng, 0.3 if wall_ratio is None else wall_ratio)
+    elif kind == "aberto":
+        free, start, exit_pos = _open_field(n, rng, 0.05 if wall_ratio is None else wall_ratio)
+    else:
+        raise ValueError(f"Tipo de labirinto desconhecido: {kind!r} (use {', '.join(KINDS)})")
+    return Maze.from_bitmap(n, free, start, exit_pos)
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv
+
+    if len(argv) < 4:
+        print("Uso: python mazegen.py <tipo> <n> <arquivo_saida> [semente]")
+        print(f"  tipo = {' | '.join(KINDS)}")
+        print("  arquivos terminados em .lab são gravados no formato binário")
+        return 1
+
+    kind, n, out = argv[1], int(argv[2]), argv[3]
+    seed = int(argv[4]) if len(argv) >= 5 else 0
+    maze = generate(kind, n, seed)
+    if out.endswith(".lab"):
+        maze.save_binary(out)
+    else:
+        maze.save_text(out)
+    print(f"Labirinto {kind} {n}x{n} (semente {seed}) gravado em {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,95 @@
+# metrics.py
+# Métricas por geração do Algoritmo Genético: interface de observação e
+# gravação em JSONL (um objeto JSON por linha).
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, IO
+import json
+
+# etapas cronometradas dentro de uma geração
+STAGES = ("avaliacao", "selecao", "cruzamento", "mutacao")
+
+
+class GAMetrics:
+    """Observador do GeneticSolver; as implementações padrão não fazem nada.
+
+    Só quando um observador é passado para `GeneticSolver.run` o solver
+    cronometra as etapas e calcula média e diversidade da população, de modo
+    que a execução sem métricas não paga nada por elas.
+    """
+
+    def on_generation(self, event: Dict[str, Any]) -> None:
+        """Chamado ao fim de cada geração avaliada.
+
+        Chaves: tentativa, geracao, melhor, media, diversidade,
+        saida_encontrada e tempos (segundos por etapa, ver STAGES).
+        """
+
+    def on_exit_found(self, event: Dict[str, Any]) -> None:
+        """Chamado quando algum indivíduo chega em S (tentativa, geracao, aptidao, genes)."""
+
+    def on_restart(self, event: Dict[str, Any]) -> None:
+        """Chamado quando uma tentativa termina sem achar S (tentativa, geracoes)."""
+
+    def close(self) -> None:
+        pass
+
+
+class CallbackMetrics(GAMetrics):
+    """Repassa todos os eventos para uma função `fn(tipo, evento)`."""
+
+    def __init__(self, fn: Callable[[str, Dict[str, Any]], None]):
+        self.fn = fn
+
+    def on_generation(self, event):
+        self.fn("geracao", event)
+
+    def on_exit_found(self, event):
+        self.fn("saida", event)
+
+    def on_restart(self, event):
+        self.fn("reinicio", event)
+
+
+class JsonlMetrics(GAMetrics):
+    """Grava cada evento como uma linha JSON com a chave "evento".
+
+    `every` > 1 grava só uma a cada `every` gerações (eventos de saída e de
+    reinício são sempre gravados). O arquivo é bufferizado e só é fechado em
+    `close` se tiver sido aberto aqui.
+    """
+
+    def __init__(self, target: str | IO[str], every: int = 1):
+        if isinstance(target, str):
+            self._stream = open(target, "w", encoding="utf-8")
+            self._owned = True
+        else:
+            self._stream = target
+            self._owned = False
+        self.every = max(1, every)
+        self._dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+    def _emit(self, kind: str, event: Dict[str, Any]) -> None:
+        self._stream.write(self._dumps({"evento": kind, **event}) + "\n")
+
+    def on_generation(self, event):
+        if event["geracao"] % self.every == 0 or event["saida_encontrada"]:
+            self._emit("geracao", event)
+
+    def on_exit_found(self, event):
+        self._emit("saida", event)
+
+    def on_restart(self, event):
+        self._emit("reinicio", event)
+
+    def close(self):
+        if self._owned:
+            self._stream.close()
+        else:
+            self._stream.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
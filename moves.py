@@ -0,0 +1,94 @@
+# moves.py
+# Codificação dos movimentos (1..8), comum ao GA e às buscas, e a tabela de
+# movimentos livres de cada célula do labirinto.
+
+from __future__ import annotations
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+import math
+import weakref
+
+from maze import Maze
+
+# A numeração é arbitrária, mas é a mesma nos genes do GA e nas buscas.
+MOVES = {
+    1: (-1, 0),   # cima
+    2: (0, 1),    # direita
+    3: (1, 0),    # baixo
+    4: (0, -1),   # esquerda
+    5: (-1, 1),   # cima-direita
+    6: (1, 1),    # baixo-direita
+    7: (1, -1),   # baixo-esquerda
+    8: (-1, -1),  # cima-esquerda
+}
+GENE_VALUES = list(MOVES.keys())
+# deslocamentos por gene em listas indexadas diretamente (posição 0 não é usada)
+GENE_DR = [0] + [MOVES[g][0] for g in GENE_VALUES]
+GENE_DC = [0] + [MOVES[g][1] for g in GENE_VALUES]
+
+# custo de passo: 1 para ortogonais, sqrt(2) para diagonais
+SQRT2 = math.sqrt(2.0)
+MOVE_COSTS = tuple(SQRT2 if dr and dc else 1.0 for dr, dc in MOVES.values())
+
+
+def path_cost(path: Sequence[Tuple[int, int]]) -> float:
+    """Custo de um caminho de células vizinhas (mesmos custos de MOVE_COSTS)."""
+    return sum(
+        SQRT2 if a[0] != b[0] and a[1] != b[1] else 1.0
+        for a, b in zip(path, path[1:])
+    )
+
+
+def gene_offsets(stride: int) -> List[int]:
+    """Deslocamento de cada gene no índice linear (posição 0 não é usada)."""
+    return [dr * stride + dc for dr, dc in zip(GENE_DR, GENE_DC)]
+
+
+def neighbor_steps(stride: int) -> List[Tuple[int, float]]:
+    """(deslocamento no índice linear, custo) de cada movimento."""
+    return [(dr * stride + dc, cost) for (dr, dc), cost in zip(MOVES.values(), MOVE_COSTS)]
+
+
+@lru_cache(maxsize=None)
+def open_steps(stride: int) -> Tuple[Tuple[Tuple[int, float], ...], ...]:
+    """Para cada máscara de 8 bits, os passos (deslocamento, custo) liberados.
+
+    `open_steps(stride)[masks[idx]]` são só os vizinhos livres de `idx`: o
+    laço de expansão das buscas não testa paredes.
+    """
+    steps = neighbor_steps(stride)
+    return tuple(
+        tuple(step for k, step in enumerate(steps) if mask >> k & 1)
+        for mask in range(256)
+    )
+
+
+# máscaras de cada labirinto, montadas no primeiro uso e reaproveitadas
+# por todas as tentativas do GA e todas as buscas
+_masks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def move_masks(maze: Maze) -> bytearray:
+    """Movimentos livres de cada posição do mapa com borda, um byte por célula.
+
+    O bit k de `masks[idx]` diz se o movimento k + 1 (ordem de MOVES) leva
+    a uma célula livre; o destino é `idx + deslocamento`. O mapa é lido como
+    um inteiro com um dígito por byte, e cada cópia deslocada entra já no
+    seu bit, então a tabela sai de 8 deslocamentos, sem laço por célula.
+    """
+    masks = _masks.get(maze)
+    if masks is not None:
+        return masks
+    free = maze.free
+    size = len(free)
+    bits = int.from_bytes(free, 'little')
+    total = 0
+    for k, (offset, _) in enumerate(neighbor_steps(maze.stride)):
+        if offset > 0:
+            total |= (bits >> (8 * offset)) << k
+        else:
+            total |= (bits << (-8 * offset)) << k
+    total &= (1 << (8 * size)) - 1
+    masks = bytearray(total.to_bytes(size, 'little'))
+    _masks[maze] = masks
+    return masks
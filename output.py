@@ -0,0 +1,125 @@
+# output.py
+# Arquivos de saída (labirinto com o caminho marcado + linha "Caminho: ...")
+# montados direto em bytes, sem copiar o labirinto como lista de listas.
+
+from __future__ import annotations
+from typing import IO, List, Tuple, Union
+import io
+import os
+import weakref
+
+from maze import Maze
+
+# buffer dos arquivos de saída
+OUTPUT_BUFFER = 1 << 20
+
+_STAR = ord('*')
+_ZERO = ord('0')
+
+# grade já formatada (com espaços e quebras de linha) de cada labirinto; a
+# saída do GA e a do A* partem da mesma cópia
+_rendered: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def format_path(path: List[Tuple[int, int]]) -> str:
+    """Formata caminho como: (0,0) (0,1) (1,1) ..."""
+    return " ".join([f"({r},{c})" for (r, c) in path])
+
+
+def maze_with_path(maze: Maze, path: List[Tuple[int, int]]):
+    """Devolve uma cópia do labirinto marcando o caminho com '*'.
+
+    Mantém o 'E' na origem e o 'S' da saída.
+    """
+    grid = maze.clone_grid()
+    if not path:
+        return grid
+
+    # ignora a posição inicial (já marcada com E)
+    for (r, c) in path[1:]:
+        # não mexe na célula da saída original
+        if (r, c) == maze.exit:
+            continue
+        # só altera células livres
+        if grid[r][c] == "0":
+            grid[r][c] = "*"
+
+    return grid
+
+
+def _render_grid(maze: Maze) -> bytes | None:
+    """Linhas do labirinto como no enunciado ("0 1 E ...\\n"), em uma passada.
+
+    Cada linha ocupa exatamente 2n bytes: a célula c da linha r fica em
+    r*2n + 2c, com espaços nas posições ímpares e '\\n' no fim. As células
+    entram todas de uma vez por atribuição de fatia com passo 2.
+    """
+    if maze in _rendered:
+        return _rendered[maze]
+    cells = maze.cell_bytes()
+    if cells is None:
+        text = None
+    else:
+        n = maze.n
+        width = 2 * n
+        buf = bytearray(b' ') * (width * n)
+        buf[0::2] = cells
+        buf[width - 1::width] = b'\n' * n
+        text = bytes(buf)
+    _rendered[maze] = text
+    return text
+
+
+def render_maze(maze: Maze, path: List[Tuple[int, int]]) -> bytes:
+    """Labirinto com as células livres do caminho marcadas com '*'.
+
+    Mesmas regras de `maze_with_path`: a origem (path[0]) e a saída não
+    são marcadas, e só células '0' viram '*'.
+    """
+    base = _render_grid(maze)
+    if base is None:
+        # marca fora do ASCII: caminho lento, via lista de listas
+        grid = maze_with_path(maze, path)
+        return "".join(" ".join(row) + "\n" for row in grid).encode("utf-8")
+    if len(path) < 2:
+        return base
+
+    out = bytearray(base)
+    width = 2 * maze.n
+    exit_pos = maze.exit
+    for r, c in path[1:]:
+        if (r, c) == exit_pos:
+            continue
+        pos = r * width + 2 * c
+        if out[pos] == _ZERO:
+            out[pos] = _STAR
+    return bytes(out)
+
+
+def render_output(maze: Maze, path: List[Tuple[int, int]]) -> bytes:
+    """Conteúdo completo do arquivo de saída, com '\\n' como quebra de linha."""
+    return b"".join((
+        f"{maze.n}\n".encode("ascii"),
+        render_maze(maze, path),
+        b"\nCaminho: ",
+        format_path(path).encode("utf-8"),
+        b"\n",
+    ))
+
+
+def write_output(target: Union[str, IO], maze: Maze, path: List[Tuple[int, int]]) -> None:
+    """Grava a saída em um arquivo (caminho) ou em um fluxo já aberto.
+
+    Fluxos de texto recebem str; fluxos binários, bytes. Em arquivo, as
+    quebras de linha seguem `os.linesep`, como na gravação em modo texto.
+    """
+    data = render_output(maze, path)
+    if isinstance(target, (str, os.PathLike)):
+        if os.linesep != "\n":
+            data = data.replace(b"\n", os.linesep.encode("ascii"))
+        with open(target, "wb", buffering=OUTPUT_BUFFER) as f:
+            f.write(data)
+    elif isinstance(target, io.TextIOBase):
+        target.write(data.decode("utf-8"))
+    else:
+        target.write(data)
@@ -0,0 +1,108 @@
+# parallel.py
+# Reinícios independentes do Algoritmo Genético distribuídos em vários processos.
+
+from __future__ import annotations
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence, Tuple
+import multiprocessing
+import os
+import random
+
+from maze import Maze
+from genetic import GAResult, GeneticSolver
+
+# Evento compartilhado pelos processos do pool; quando um deles chega em S,
+# os demais param na próxima geração.
+_stop_event = None
+
+
+@dataclass
+class ParallelResult:
+    chromosome: List[int]
+    path: List[Tuple[int, int]]
+    seed: int
+
+
+def _init_worker(stop_event) -> None:
+    global _stop_event
+    _stop_event = stop_event
+
+
+def _run_seeded(maze: Maze, seed: int, solver_kwargs: Dict[str, Any], run_kwargs: Dict[str, Any]):
+    """Executa uma ilha isolada do GA com a semente dada (roda no processo filho)."""
+    solver = GeneticSolver(maze, seed=seed, **solver_kwargs)
+    # a alcançabilidade já foi conferida pelo processo principal
+    result = solver.run(verbose=False, should_stop=_stop_event.is_set, check_reachable=False, **run_kwargs)
+    path = result.path
+    found = result.found and bool(path) and path[-1] == maze.exit
+    if found:
+        _stop_event.set()
+    return seed, result.chromosome, path, found
+
+
+def run_parallel(
+    maze: Maze,
+    islands: int | None = None,
+    workers: int | None = None,
+    seeds: Sequence[int] | None = None,
+    base_seed: int | None = None,
+    run_kwargs: Dict[str, Any] | None = None,
+    **solver_kwargs,
+) -> ParallelResult | None:
+    """Roda `islands` execuções independentes do GA em paralelo.
+
+    Cada ilha usa uma semente própria (`seeds`, ou `base_seed + i`). Assim que
+    a primeira chega em S, as outras são canceladas e o vencedor é devolvido
+    junto com a semente, que reproduz o resultado em um único núcleo com
+    `reproduce(maze, seed, **solver_kwargs)`. Devolve None se nenhuma ilha
+    chegar em S (ou se S não for alcançável, o que é conferido antes de
+    criar os processos).
+
+    `run_kwargs` vai para o `GeneticSolver.run` de cada ilha (limites de
+    tempo, avaliações, estagnação ou tentativas, valendo por ilha).
+    """
+    if not maze.is_reachable():
+        return None
+    run_kwargs = run_kwargs or {}
+    if seeds is None:
+        islands = islands or os.cpu_count() or 1
+        if base_seed is None:
+            base_seed = random.randrange(2 ** 31)
+        seeds = [base_seed + i for i in range(islands)]
+    workers = workers or min(len(seeds), os.cpu_count() or 1)
+
+    ctx = multiprocessing.get_context()
+    stop_event = ctx.Event()
+    winner: ParallelResult | None = None
+
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=ctx,
+        initializer=_init_worker, initargs=(stop_event,),
+    ) as pool:
+        pending = {pool.submit(_run_seeded, maze, seed, solver_kwargs, run_kwargs) for seed in seeds}
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                seed, chrom, path, found = fut.result()
+                if found and winner is None:
+                    winner = ParallelResult(chromosome=chrom, path=path, seed=seed)
+        # ilhas ainda na fila nem chegam a começar
+        stop_event.set()
+        for fut in pending:
+            fut.cancel()
+
+    return winner
+
+
+def reproduce(
+    maze: Maze,
+    seed: int,
+    detailed: bool = False,
+    print_interval: int = 10,
+    run_kwargs: Dict[str, Any] | None = None,
+    **solver_kwargs,
+) -> GAResult:
+    """Refaz, em um único núcleo, a execução de uma ilha a partir da semente."""
+    solver = GeneticSolver(maze, seed=seed, **solver_kwargs)
+    return solver.run(detailed=detailed, print_interval=print_interval, **(run_kwargs or {}))
@@ -0,0 +1,255 @@
+# prune.py
+# Pré-processamento do labirinto: preenchimento de becos sem saída e
+# compressão de corredores num grafo de junções com custos nas arestas.
+
+from __future__ import annotations
+from array import array
+from typing import Dict, Iterable, Tuple
+import heapq
+import math
+import re
+import weakref
+
+from maze import Maze
+from astar import _octile
+from moves import MOVES, neighbor_steps
+
+# células com no máximo três vizinhos livres (as únicas que podem ser becos)
+_AT_MOST_THREE = bytes(1 if b <= 3 else 0 for b in range(256))
+_ONE = re.compile(b'\x01')
+
+
+def _degrees(free: bytearray, stride: int) -> bytearray:
+    """Número de vizinhos livres (8 direções) de cada posição do mapa com borda.
+
+    O mapa é lido como um inteiro com um dígito por byte; somar as oito
+    cópias deslocadas soma os vizinhos de todas as células de uma vez, sem
+    vai-um (cada byte fica entre 0 e 8).
+    """
+    size = len(free)
+    bits = int.from_bytes(free, 'little')
+    total = 0
+    for offset, _ in neighbor_steps(stride):
+        if offset > 0:
+            total += bits >> (8 * offset)
+        else:
+            total += bits << (-8 * offset)
+    total &= (1 << (8 * size)) - 1
+    return bytearray(total.to_bytes(size, 'little'))
+
+
+def _is_dead_end(free: bytearray, node: int, stride: int) -> bool:
+    """Beco no grid 8-conexo: os vizinhos livres são todos vizinhos entre si.
+
+    Aí qualquer caminho que passe pela célula (entrando por um vizinho e
+    saindo por outro) fica mais barato indo direto de um vizinho ao outro,
+    então ela não está em nenhum caminho mínimo. Inclui o beco clássico, com
+    um vizinho só; os vizinhos mutuamente adjacentes cabem num quadrado 2x2.
+    """
+    min_r = min_c = 1
+    max_r = max_c = -1
+    for dr, dc in MOVES.values():
+        if free[node + dr * stride + dc]:
+            if dr < min_r:
+                min_r = dr
+            if dr > max_r:
+                max_r = dr
+            if dc < min_c:
+                min_c = dc
+            if dc > max_c:
+                max_c = dc
+    return max_r - min_r <= 1 and max_c - min_c <= 1
+
+
+def fill_dead_ends(maze: Maze, keep: Iterable[Tuple[int, int]] | None = None) -> Maze:
+    """Cópia do labirinto com os becos sem saída emparedados.
+
+    Um beco (ver `_is_dead_end`) nunca está no meio de um caminho mínimo;
+    ele vira parede e os vizinhos são reexaminados, até não haver mais
+    becos. As células de `keep` (padrão: E e S) nunca são removidas, de modo
+    que a distância entre quaisquer células restantes não muda. As marcas
+    (E, S) são mantidas, então a saída pode ser desenhada sobre o labirinto
+    original ou sobre a cópia.
+    """
+    if keep is None:
+        keep = (maze.start, maze.exit)
+    stride = maze.stride
+    free = bytearray(maze.free)
+    degree = _degrees(free, stride)
+    protected = {maze.index(r, c) for r, c in keep if maze.is_inside(r, c)}
+    offsets = [offset for offset, _ in neighbor_steps(stride)]
+
+    # só células com até três vizinhos livres podem ser becos
+    candidates = (int.from_bytes(free, 'little') & int.from_bytes(degree.translate(_AT_MOST_THREE), 'little'))
+    stack = [m.start() for m in _ONE.finditer(candidates.to_bytes(len(free), 'little'))]
+    while stack:
+        node = stack.pop()
+        if not free[node] or node in protected or degree[node] > 3 or not _is_dead_end(free, node, stride):
+            continue
+        free[node] = 0
+        for offset in offsets:
+            neighbor = node + offset
+            if free[neighbor]:
+                degree[neighbor] -= 1
+                if degree[neighbor] <= 3:
+                    stack.append(neighbor)
+    return Maze.from_bitmap(maze.n, free, maze.start, maze.exit, dict(maze.marks))
+
+
+class JunctionGraph:
+    """Grafo ponderado das junções do labirinto.
+
+    Nós são as células livres com grau diferente de 2 (junções e pontas),
+    mais as células de `keep`; cada aresta é um corredor (sequência de
+    células de grau 2) entre dois nós, com o custo somado dos passos e as
+    células intermediárias, para expandir o caminho de volta. Uma célula de
+    `keep` na parede também é nó, ligada aos vizinhos livres por arestas de
+    um passo que só saem dela (como em `astar`, a partida pode ser parede).
+    """
+
+    def __init__(self, maze: Maze, keep: Iterable[Tuple[int, int]] | None = None):
+        if keep is None:
+            keep = (maze.start, maze.exit)
+        self.maze = maze
+        stride = maze.stride
+        free = maze.free
+        degree = _degrees(free, stride)
+        steps = neighbor_steps(stride)
+
+        nodes = {maze.index(r, c) for r, c in keep if maze.is_inside(r, c)}
+        for idx in list(nodes):
+            if not free[idx]:
+                nodes.update(idx + offset for offset, _ in steps if free[idx + offset])
+        for m in _ONE.finditer(free):
+            idx = m.start()
+            if degree[idx] != 2:
+                nodes.add(idx)
+        self.nodes = nodes
+
+        # edges[u] = {v: (custo, células entre u e v, de u para v)}
+        edges: Dict[int, Dict[int, Tuple[float, array]]] = {u: {} for u in nodes}
+        for u in nodes:
+            for offset, step_cost in steps:
+                cur = u + offset
+                if not free[cur]:
+                    continue
+                prev = u
+                cost = step_cost
+                cells = array('i')
+                while cur not in nodes:
+                    cells.append(cur)
+                    # grau 2: o único vizinho livre que não é de onde viemos
+                    for off2, cost2 in steps:
+                        nxt = cur + off2
+                        if nxt != prev and free[nxt]:
+                            break
+                    prev, cur = cur, nxt
+                    cost += cost2
+                if cur == u:
+                    continue
+                best = edges[u].get(cur)
+                if best is None or cost < best[0]:
+                    edges[u][cur] = (cost, cells)
+        self.edges = edges
+
+    def edge_count(self) -> int:
+        return sum(len(out) for out in self.edges.values()) // 2
+
+    def search(
+        self,
+        start: Tuple[int, int],
+        goal: Tuple[int, int],
+        stats: Dict[str, int] | None = None,
+    ):
+        """A* sobre o grafo (heurística octil), com o caminho expandido em células.
+
+        `start` e `goal` precisam ser nós do grafo (ver `keep`). Devolve None
+        se não houver caminho; como em `astar`, um objetivo na parede nunca é
+        alcançado, mas a partida pode ser parede.
+        """
+        maze = self.maze
+        stride = maze.stride
+        src = maze.index(*start)
+        dst = maze.index(*goal)
+        if src != dst and not maze.free[dst]:
+            if stats is not None:
+                stats["expanded"] = 0
+            return None
+        if src not in self.nodes or dst not in self.nodes:
+            raise ValueError("início e objetivo precisam ser nós do grafo (parâmetro keep)")
+        goal_r, goal_c = divmod(dst, stride)
+        edges = self.edges
+        push = heapq.heappush
+        pop = heapq.heappop
+
+        g = {src: 0.0}
+        parent = {src: -1}
+        closed = set()
+        open_heap = [(_octile(start[0] - goal[0], start[1] - goal[1]), src)]
+        expanded = 0
+        found = False
+        while open_heap:
+            _, current = pop(open_heap)
+            if current in closed:
+                continue
+            if current == dst:
+                found = True
+                break
+            closed.add(current)
+            expanded += 1
+            current_g = g[current]
+            for neighbor, (cost, _) in edges[current].items():
+                if neighbor in closed:
+                    continue
+                tentative_g = current_g + cost
+                if tentative_g < g.get(neighbor, math.inf):
+                    g[neighbor] = tentative_g
+                    parent[neighbor] = current
+                    nr, nc = divmod(neighbor, stride)
+                    push(open_heap, (tentative_g + _octile(nr - goal_r, nc - goal_c), neighbor))
+
+        if stats is not None:
+            stats["expanded"] = expanded
+        if not found:
+            return None
+
+        chain = [dst]
+        while parent[chain[-1]] >= 0:
+            chain.append(parent[chain[-1]])
+        chain.reverse()
+        coords = maze.coords
+        path = [coords(src)]
+        for u, v in zip(chain, chain[1:]):
+            path.extend(coords(idx) for idx in edges[u][v][1])
+            path.append(coords(v))
+        return path
+
+
+# grafo de cada labirinto (já sem becos), montado na primeira busca
+_graphs: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def graph_search(
+    maze: Maze,
+    start: Tuple[int, int],
+    goal: Tuple[int, int],
+    stats: Dict[str, int] | None = None,
+):
+    """Mesmo contrato de `astar`: poda os becos, comprime os corredores e
+    busca no grafo de junções (o grafo de E a S fica em cache por labirinto).
+    """
+    key = (start, goal)
+    cached = _graphs.get(maze)
+    if cached is not None and cached[0] == key:
+        graph = cached[1]
+    else:
+        # com a partida na parede, os vizinhos livres dela são a saída e
+        # também não podem ser emparedados
+        keep = list(key)
+        if maze.is_inside(*start) and not maze.is_free(*start):
+            src = maze.index(*start)
+            keep.extend(maze.coords(src + offset) for offset, _ in neighbor_steps(maze.stride)
+                        if maze.free[src + offset])
+        graph = JunctionGraph(fill_dead_ends(maze, keep), key)
+        _graphs[maze] = (key, graph)
+    return graph.search(start, goal, stats)
@@ -0,0 +1,408 @@
+# service.py
+# Serviço local de resolução: recebe labirintos (em processo ou por um
+# socket Unix), resolve num pool de processos e guarda os caminhos num
+# cache LRU, para que labirintos repetidos não sejam resolvidos de novo.
+
+from __future__ import annotations
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Tuple
+import argparse
+import asyncio
+import base64
+import json
+import os
+import sys
+import time
+
+from maze import BINARY_MAGIC, Maze
+from genetic import STOP_UNREACHABLE, GeneticSolver
+from moves import path_cost
+from main import SEARCHES
+
+# "genetico" roda o GA; os demais são as buscas do caminho ótimo do main.py
+METHODS = ("genetico",) + tuple(SEARCHES)
+DEFAULT_GA_TIME = 60.0
+# linhas de até 64 MiB no socket (um labirinto 1000 x 1000 em texto tem ~2 MiB)
+_LINE_LIMIT = 64 * 1024 * 1024
+
+CacheKey = Tuple[str, Tuple[int, int], Tuple[int, int], str, Any]
+
+
+@dataclass
+class SolveResult:
+    """Resposta do serviço para um labirinto.
+
+    `path` é None quando não há caminho (ou o GA parou antes de chegar em
+    S; `reason` diz por quê). `elapsed` é o tempo da resolução original,
+    mesmo quando a resposta veio do cache (`cached`).
+    """
+    method: str
+    path: List[Tuple[int, int]] | None
+    cost: float | None
+    reason: str | None
+    elapsed: float
+    cached: bool = False
+
+    @property
+    def found(self) -> bool:
+        return self.path is not None
+
+    def to_json(self) -> Dict[str, Any]:
+        if self.found:
+            status = "ok"
+        elif self.reason in (None, STOP_UNREACHABLE):
+            status = "sem_caminho"
+        else:
+            status = "ga_falhou"
+        record: Dict[str, Any] = {"status": status, "metodo": self.method}
+        if self.path is not None:
+            record["passos"] = len(self.path) - 1
+            record["custo"] = self.cost
+            record["caminho"] = self.path
+        if self.reason is not None:
+            record["motivo"] = self.reason
+        record["cache"] = self.cached
+        record["tempo_s"] = self.elapsed
+        return record
+
+
+def parse_maze(payload) -> Maze:
+    """Labirinto a partir do conteúdo de um arquivo (texto ou binário)."""
+    if isinstance(payload, str):
+        payload = payload.encode('utf-8')
+    if payload[:len(BINARY_MAGIC)] == BINARY_MAGIC:
+        return Maze.from_binary(payload)
+    return Maze.from_bytes(payload)
+
+
+def _prepare(payload) -> Tuple[Maze, str]:
+    maze = payload if isinstance(payload, Maze) else parse_maze(payload)
+    return maze, maze.content_hash()
+
+
+def _solve(maze: Maze, method: str, seed: int | None, time_limit: float | None) -> SolveResult:
+    """Resolve um labirinto (roda no executor)."""
+    t0 = time.perf_counter()
+    if method == "genetico":
+        result = GeneticSolver(maze, seed=seed).run(verbose=False, time_limit=time_limit)
+        path = result.path if result.found else None
+        reason = result.reason
+    else:
+        path = SEARCHES[method](maze, maze.start, maze.exit)
+        reason = None
+    return SolveResult(
+        method=method,
+        path=path,
+        cost=path_cost(path) if path else None,
+        reason=reason,
+        elapsed=time.perf_counter() - t0,
+    )
+
+
+class PathCache:
+    """Cache LRU de resultados, limitado em entradas e em células de caminho.
+
+    O tamanho de cada entrada é o número de células do caminho (mais uma),
+    que é o que domina a memória; ao passar de qualquer um dos limites, as
+    entradas usadas há mais tempo saem primeiro.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_cells: int = 1_000_000):
+        self.max_entries = max_entries
+        self.max_cells = max_cells
+        self.cells = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[CacheKey, SolveResult] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _size(result: SolveResult) -> int:
+        return len(result.path or ()) + 1
+
+    def get(self, key: CacheKey) -> SolveResult | None:
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def put(self, key: CacheKey, result: SolveResult) -> None:
+        size = self._size(result)
+        if size > self.max_cells:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.cells -= self._size(old)
+        self._entries[key] = result
+        self.cells += size
+        while len(self._entries) > self.max_entries or self.cells > self.max_cells:
+            _, evicted = self._entries.popitem(last=False)
+            self.cells -= self._size(evicted)
+            self.evictions += 1
+
+
+class SolveService:
+    """Resolve labirintos de forma assíncrona, com cache e sem trabalho repetido.
+
+    `solve` lê o labirinto numa thread, procura o resultado no cache (chave:
+    hash do conteúdo, entrada, saída, método e semente) e, se não achar,
+    resolve no `executor` (por padrão um pool de `workers` processos).
+    Pedidos iguais que chegam enquanto o primeiro ainda está sendo resolvido
+    esperam o mesmo resultado em vez de resolver de novo.
+
+    Só resultados definitivos vão para o cache: um caminho encontrado, ou a
+    ausência de caminho dada por uma busca ou pela conferência de
+    alcançabilidade do GA. Um GA que parou por limite pode ter sorte na
+    próxima vez.
+    """
+
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        workers: int | None = None,
+        cache_entries: int = 1024,
+        cache_cells: int = 1_000_000,
+        ga_time_limit: float | None = DEFAULT_GA_TIME,
+    ):
+        self._own_executor = executor is None
+        self.executor = executor or ProcessPoolExecutor(max_workers=workers)
+        self.cache = PathCache(cache_entries, cache_cells)
+        self.ga_time_limit = ga_time_limit
+        self.solved = 0
+        self.shared = 0
+        self._inflight: Dict[CacheKey, asyncio.Future] = {}
+
+    async def solve(
+        self,
+        payload,
+        method: str = "astar",
+        seed: int | None = None,
+        time_limit: float | None = None,
+    ) -> SolveResult:
+        """Resolve `payload` (um `Maze` ou o conteúdo de um arquivo, texto ou binário).
+
+        `seed` e `time_limit` só valem para o GA; sem `time_limit`, vale o
+        `ga_time_limit` do serviço. ValueError se o método não existir ou
+        o labirinto for inválido.
+        """
+        if method not in METHODS:
+            raise ValueError(f"Método desconhecido: {method} (opções: {', '.join(METHODS)})")
+        if method != "genetico":
+            seed = None
+        loop = asyncio.get_running_loop()
+        maze, digest = await loop.run_in_executor(None, _prepare, payload)
+        key: CacheKey = (digest, maze.start, maze.exit, method, seed)
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            return replace(cached, cached=True)
+
+        future = self._inflight.get(key)
+        if future is None:
+            if time_limit is None:
+                time_limit = self.ga_time_limit
+            future = loop.run_in_executor(self.executor, _solve, maze, method, seed, time_limit)
+            self._inflight[key] = future
+            future.add_done_callback(lambda fut: self._finished(key, fut))
+        else:
+            self.shared += 1
+        # um pedido cancelado não cancela a resolução dos outros que esperam
+        return await asyncio.shield(future)
+
+    def _finished(self, key: CacheKey, future: asyncio.Future) -> None:
+        del self._inflight[key]
+        if future.cancelled() or future.exception() is not None:
+            return
+        result = future.result()
+        self.solved += 1
+        if result.found or result.reason in (None, STOP_UNREACHABLE):
+            self.cache.put(key, result)
+
+    def stats(self) -> Dict[str, int]:
+        cache = self.cache
+        return {
+            "resolvidos": self.solved,
+            "compartilhados": self.shared,
+            "em_andamento": len(self._inflight),
+            "cache_acertos": cache.hits,
+            "cache_falhas": cache.misses,
+            "cache_entradas": len(cache),
+            "cache_celulas": cache.cells,
+            "cache_descartes": cache.evictions,
+        }
+
+    def close(self) -> None:
+        if self._own_executor:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+
+    async def __aenter__(self) -> "SolveService":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+
+async def _handle_request(service: SolveService, request: Dict[str, Any]) -> Dict[str, Any]:
+    if not isinstance(request, dict):
+        raise ValueError("O pedido deve ser um objeto JSON")
+    if request.get("comando") == "estatisticas":
+        return {"status": "ok", **service.stats()}
+    if "labirinto_b64" in request:
+        payload = base64.b64decode(request["labirinto_b64"])
+    elif "labirinto" in request:
+        payload = request["labirinto"]
+    else:
+        raise ValueError("Pedido sem 'labirinto' nem 'labirinto_b64'")
+    result = await service.solve(
+        payload,
+        method=request.get("metodo", "astar"),
+        seed=request.get("semente"),
+        time_limit=request.get("tempo"),
+    )
+    return result.to_json()
+
+
+async def _handle_connection(service: SolveService, reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter) -> None:
+    """Uma linha JSON por pedido e uma por resposta.
+
+    Os pedidos de uma conexão são resolvidos ao mesmo tempo, então as
+    respostas saem na ordem de término; o campo "id" do pedido é repetido
+    na resposta.
+    """
+    lock = asyncio.Lock()
+    tasks = set()
+
+    async def answer(line: bytes) -> None:
+        request: Dict[str, Any] = {}
+        try:
+            request = json.loads(line)
+            response = await _handle_request(service, request)
+        except (ValueError, TypeError, KeyError) as e:
+            response = {"status": "erro", "erro": str(e)}
+        except Exception as e:
+            # falha na resolução (ex.: pool de processos quebrado): toda
+            # linha de pedido recebe uma resposta
+            response = {"status": "erro", "erro": f"{type(e).__name__}: {e}"}
+        if isinstance(request, dict) and "id" in request:
+            response["id"] = request["id"]
+        async with lock:
+            writer.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b"\n")
+            await writer.drain()
+
+    try:
+        while line := await reader.readline():
+            if line.strip():
+                task = asyncio.create_task(answer(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks)
+    except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+        pass
+    finally:
+        for task in tasks:
+            task.cancel()
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            # o cliente já fechou a conexão
+            pass
+
+
+async def serve(service: SolveService, path: str) -> None:
+    """Atende pedidos no socket Unix `path` até ser cancelado."""
+    if os.path.exists(path):
+        os.unlink(path)
+    server = await asyncio.start_unix_server(
+        lambda r, w: _handle_connection(service, r, w), path, limit=_LINE_LIMIT,
+    )
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+async def request(path: str, message: Dict[str, Any]) -> Dict[str, Any]:
+    """Envia um pedido ao serviço no socket `path` e devolve a resposta."""
+    reader, writer = await asyncio.open_unix_connection(path, limit=_LINE_LIMIT)
+    try:
+        writer.write(json.dumps(message).encode('utf-8') + b"\n")
+        await writer.drain()
+        return json.loads(await reader.readline())
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv
+
+    parser = argparse.ArgumentParser(
+        prog="service.py",
+        description="Serviço local de resolução de labirintos num socket Unix, com cache LRU.",
+    )
+    parser.add_argument("--socket", default="labirinto.sock", metavar="ARQ",
+                        help="caminho do socket Unix (padrão: labirinto.sock)")
+    parser.add_argument("--enviar", nargs="+", default=None, metavar="LABIRINTO",
+                        help="em vez de atender, envia estes labirintos a um serviço já no ar")
+    parser.add_argument("--metodo", choices=METHODS, default="astar",
+                        help="com --enviar: método de resolução (padrão: astar)")
+    parser.add_argument("--semente", type=int, default=None, metavar="S",
+                        help="com --enviar: semente do GA")
+    parser.add_argument("--trabalhadores", type=int, default=None, metavar="N",
+                        help="processos do pool (padrão: número de núcleos)")
+    parser.add_argument("--cache-entradas", type=int, default=1024, metavar="N",
+                        help="resultados guardados no cache (padrão 1024)")
+    parser.add_argument("--cache-celulas", type=int, default=1_000_000, metavar="N",
+                        help="total de células de caminho no cache (padrão 1000000)")
+    parser.add_argument("--ga-tempo", type=float, default=DEFAULT_GA_TIME, metavar="SEGUNDOS",
+                        help="tempo máximo do GA por pedido (padrão 60; 0 = sem limite)")
+    args = parser.parse_args(argv[1:])
+
+    if args.enviar:
+        async def send_all() -> int:
+            failures = 0
+            for lab_file in args.enviar:
+                with open(lab_file, 'rb') as f:
+                    data = f.read()
+                message = {"id": lab_file, "labirinto_b64": base64.b64encode(data).decode('ascii'),
+                           "metodo": args.metodo, "semente": args.semente}
+                response = await request(args.socket, message)
+                failures += response.get("status") != "ok"
+                print(json.dumps(response, ensure_ascii=False))
+            return failures
+
+        return 1 if asyncio.run(send_all()) else 0
+
+    async def run_service() -> None:
+        async with SolveService(
+            workers=args.trabalhadores,
+            cache_entries=args.cache_entradas,
+            cache_cells=args.cache_celulas,
+            ga_time_limit=args.ga_tempo or None,
+        ) as service:
+            print(f"Atendendo em {args.socket} (Ctrl+C para parar)", file=sys.stderr)
+            await serve(service, args.socket)
+
+    try:
+        asyncio.run(run_service())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
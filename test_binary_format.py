@@ -0,0 +1,96 @@
+# test_binary_format.py
+# Ida e volta do formato binário de labirinto (maze.py / converter.py) e
+# rejeição de arquivos truncados ou corrompidos.
+
+import pytest
+
+from maze import BINARY_HEADER, BINARY_MAGIC, Maze
+from mazegen import generate
+from converter import to_binary, to_text
+
+EXAMPLE = """5
+E 0 1 0 0
+1 0 1 0 1
+0 0 0 0 1
+0 1 1 0 0
+0 0 0 1 S
+"""
+
+
+def _write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def _same(a: Maze, b: Maze) -> bool:
+    return (a.n, a.free, a.start, a.exit) == (b.n, b.free, b.start, b.exit)
+
+
+@pytest.mark.parametrize("kind, n", [("backtracker", 9), ("aleatorio", 13), ("aberto", 8), ("aleatorio", 2)])
+def test_round_trip_generated(tmp_path, kind, n):
+    maze = generate(kind, n, seed=3)
+    path = str(tmp_path / "lab.lab")
+    maze.save_binary(path)
+    loaded = Maze.load(path)
+    assert _same(loaded, maze)
+
+
+def test_converter_round_trip_keeps_text(tmp_path):
+    src = _write(tmp_path, "lab.txt", EXAMPLE)
+    binary = str(tmp_path / "lab.lab")
+    back = str(tmp_path / "volta.txt")
+    to_binary(src, binary)
+    to_text(binary, back)
+    assert _same(Maze.load(back), Maze.from_file(src))
+    with open(back, encoding="utf-8") as f:
+        assert f.read() == EXAMPLE
+
+
+def test_from_binary_rejects_bad_magic():
+    with pytest.raises(ValueError):
+        Maze.from_binary(b"XXXX" + bytes(24))
+
+
+def test_from_binary_rejects_short_header():
+    with pytest.raises(ValueError):
+        Maze.from_binary(BINARY_MAGIC + b"\x05\x00")
+
+
+def test_from_binary_rejects_truncated_body():
+    data = bytearray()
+    maze = generate("aleatorio", 16, seed=1)
+    data += BINARY_HEADER.pack(BINARY_MAGIC, maze.n, *maze.start, *maze.exit, 0)
+    data += bytes(2 * maze.n - 1)  # falta um byte da última linha
+    with pytest.raises(ValueError):
+        Maze.from_binary(bytes(data))
+
+
+def test_from_binary_rejects_corrupt_size(tmp_path):
+    maze = generate("aberto", 6, seed=2)
+    path = tmp_path / "lab.lab"
+    maze.save_binary(str(path))
+    data = bytearray(path.read_bytes())
+    # n adulterado: o arquivo não tem linhas suficientes
+    magic, _, *rest = BINARY_HEADER.unpack_from(data, 0)
+    BINARY_HEADER.pack_into(data, 0, magic, 1000, *rest)
+    with pytest.raises(ValueError):
+        Maze.from_binary(bytes(data))
+
+
+@pytest.mark.parametrize("start, exit_pos", [((0, 6), (5, 5)), ((0, 0), (-1, 5)), ((0, 0), (2, 99))])
+def test_from_binary_rejects_out_of_range_marks(tmp_path, start, exit_pos):
+    maze = generate("aberto", 6, seed=2)
+    path = tmp_path / "lab.lab"
+    maze.save_binary(str(path))
+    data = bytearray(path.read_bytes())
+    BINARY_HEADER.pack_into(data, 0, BINARY_MAGIC, maze.n, *start, *exit_pos, 0)
+    with pytest.raises(ValueError):
+        Maze.from_binary(bytes(data))
+
+
+def test_load_rejects_empty_file(tmp_path):
+    path = tmp_path / "vazio.lab"
+    path.write_bytes(b"")
+    with pytest.raises(ValueError):
+        Maze.load(str(path))
@@ -0,0 +1,100 @@
+# test_checkpoint.py
+# Formato dos checkpoints do GA (checkpoint.py) e retomada exata de uma
+# execução interrompida.
+
+import pytest
+
+from checkpoint import (
+    CheckpointWriter, decode_checkpoint, encode_checkpoint, load_checkpoint, save_checkpoint,
+)
+from genetic import STOP_EVALUATIONS, GeneticSolver
+from mazegen import generate
+
+
+@pytest.fixture
+def maze():
+    return generate("aberto", 12, seed=5)
+
+
+def _stopped(maze, tmp_path, evaluations=200, **solver_kwargs):
+    """Roda o GA até esgotar `evaluations` e devolve o solver e o checkpoint gravado."""
+    path = str(tmp_path / "ga.ckpt")
+    solver = GeneticSolver(maze, seed=7, **solver_kwargs)
+    result = solver.run(verbose=False, max_evaluations=evaluations, checkpoint=path)
+    assert result.reason == STOP_EVALUATIONS
+    return path, load_checkpoint(path)
+
+
+def test_round_trip(maze, tmp_path):
+    _, state = _stopped(maze, tmp_path)
+    assert decode_checkpoint(encode_checkpoint(state)) == state
+    assert state.evaluations == 200
+    assert state.best_chromosome is not None
+
+
+def test_round_trip_without_best(maze, tmp_path):
+    _, state = _stopped(maze, tmp_path)
+    state.best_chromosome = None
+    state.rng_state = (state.rng_state[0], state.rng_state[1], 0.25)
+    assert decode_checkpoint(encode_checkpoint(state)) == state
+
+
+def test_writer_keeps_latest(maze, tmp_path):
+    _, state = _stopped(maze, tmp_path)
+    path = str(tmp_path / "outro.ckpt")
+    with CheckpointWriter(path) as writer:
+        writer.submit(state)
+        state2 = decode_checkpoint(encode_checkpoint(state))
+        state2.generation += 1
+        writer.submit(state2)
+    assert load_checkpoint(path) == state2
+
+
+@pytest.mark.parametrize("cut", [0, 3, 10, 60, 2600, -1])
+def test_truncated_input_is_rejected(maze, tmp_path, cut):
+    _, state = _stopped(maze, tmp_path)
+    data = encode_checkpoint(state)
+    with pytest.raises(ValueError):
+        decode_checkpoint(data[:cut] if cut >= 0 else data[:-1])
+
+
+def test_trailing_garbage_is_rejected(maze, tmp_path):
+    _, state = _stopped(maze, tmp_path)
+    with pytest.raises(ValueError):
+        decode_checkpoint(encode_checkpoint(state) + b"\0")
+
+
+def test_bad_magic_and_version(maze, tmp_path):
+    _, state = _stopped(maze, tmp_path)
+    data = bytearray(encode_checkpoint(state))
+    with pytest.raises(ValueError):
+        decode_checkpoint(b"XXXX" + bytes(data[4:]))
+    data[4] = 99  # versão
+    with pytest.raises(ValueError):
+        decode_checkpoint(bytes(data))
+
+
+def test_save_is_atomic_and_leaves_no_temp(maze, tmp_path):
+    path, state = _stopped(maze, tmp_path)
+    save_checkpoint(path, state)
+    assert [p.name for p in tmp_path.iterdir()] == ["ga.ckpt"]
+
+
+@pytest.mark.parametrize("adaptive", [False, True])
+def test_resume_matches_uninterrupted_run(tmp_path, adaptive):
+    # labirinto que o GA não resolve no orçamento: a retomada atravessa reinícios
+    maze = generate("backtracker", 15, seed=5)
+    full = GeneticSolver(maze, seed=7, adaptive=adaptive).run(verbose=False, max_evaluations=3000)
+    path, _ = _stopped(maze, tmp_path, evaluations=1000, adaptive=adaptive)
+    resumed = GeneticSolver(maze, seed=7, adaptive=adaptive).resume(
+        path, verbose=False, max_evaluations=3000)
+    assert (resumed.chromosome, resumed.reason, resumed.generations, resumed.evaluations) == \
+        (full.chromosome, full.reason, full.generations, full.evaluations)
+
+
+def test_checkpoint_from_other_configuration_is_rejected(maze, tmp_path):
+    _, state = _stopped(maze, tmp_path)
+    with pytest.raises(ValueError):
+        GeneticSolver(maze, population_size=9).check_checkpoint(state)
+    with pytest.raises(ValueError):
+        GeneticSolver(generate("aberto", 12, seed=6)).check_checkpoint(state)
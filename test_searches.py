@@ -0,0 +1,49 @@
+# test_searches.py
+# Contrato comum das buscas do caminho ótimo (main.SEARCHES): mesmo custo
+# que `astar` e mesmo tratamento de partida e objetivo na parede (também
+# para o campo de distâncias, usado no lugar delas com --campo).
+
+import pytest
+
+from maze import Maze
+from distfield import build_distance_field
+from main import SEARCHES
+from mazegen import generate
+from moves import path_cost
+
+SEARCH_NAMES = sorted(SEARCHES)
+
+
+@pytest.mark.parametrize("name", SEARCH_NAMES)
+def test_goal_in_wall_has_no_path(name):
+    maze = Maze([['0', '0'], ['0', '1']], (0, 0), (1, 1))
+    stats = {}
+    assert SEARCHES[name](maze, (0, 0), (1, 1), stats) is None
+
+
+@pytest.mark.parametrize("name", SEARCH_NAMES)
+def test_start_in_wall_leaves_it(name):
+    # sem 'E' no arquivo a partida é (0, 0), que pode ser parede
+    maze = Maze([['1', '0', '1'], ['1', '1', '0'], ['1', '1', '0']], (0, 0), (2, 2))
+    assert SEARCHES[name](maze, (0, 0), (2, 2)) == [(0, 0), (0, 1), (1, 2), (2, 2)]
+    assert SEARCHES[name](maze, (0, 0), (0, 0)) == [(0, 0)]
+
+
+@pytest.mark.parametrize("name", SEARCH_NAMES)
+@pytest.mark.parametrize("kind, n, seed", [("backtracker", 15, 1), ("aleatorio", 20, 2), ("aberto", 12, 3)])
+def test_same_cost_as_astar(name, kind, n, seed):
+    maze = generate(kind, n, seed=seed)
+    expected = SEARCHES["astar"](maze, maze.start, maze.exit)
+    path = SEARCHES[name](maze, maze.start, maze.exit)
+    assert path[0] == maze.start and path[-1] == maze.exit
+    assert path_cost(path) == pytest.approx(path_cost(expected))
+
+
+def test_distance_field_matches_astar_on_walls():
+    # main.py usa o campo no lugar da busca escolhida quando há --campo
+    maze = Maze([['1', '0', '1'], ['1', '1', '0'], ['1', '1', '0']], (0, 0), (2, 2))
+    field = build_distance_field(maze)
+    assert field.path_from((0, 0)) == SEARCHES["astar"](maze, (0, 0), (2, 2))
+    walled = build_distance_field(Maze([['0', '0'], ['0', '1']], (0, 0), (1, 1)))
+    assert walled.path_from((0, 0)) is None
+    assert walled.path_from((1, 1)) == [(1, 1)]